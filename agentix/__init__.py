@@ -17,15 +17,27 @@ from .commands import ProviderCommands, ConfigCommands, ModelCommands
 from .syntax_highlighter import SyntaxHighlighter, ColorScheme, TokenType
 from .code_viewer import CodeViewer
 from .diff_utils import DiffViewer
-from .providers import (
-    AIProvider,
-    ClaudeProvider,
-    OpenAIProvider,
-    GeminiProvider,
-    OpenRouterProvider,
-    OllamaProvider,
-    ProviderRouter,
-)
+from .providers import AIProvider
+from .providers.router import ProviderRouter
+
+# Concrete provider classes import heavy SDKs, so they are re-exported
+# lazily (see agentix.providers.__getattr__) instead of imported here.
+_LAZY_PROVIDER_EXPORTS = {
+    "ClaudeProvider",
+    "OpenAIProvider",
+    "GeminiProvider",
+    "OpenRouterProvider",
+    "OllamaProvider",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDER_EXPORTS:
+        from . import providers
+        value = getattr(providers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "Orchestrator",
@@ -2,6 +2,11 @@ import os
 import yaml
 from typing import Dict, Any, Optional
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 DEFAULT_CONFIG = {
     "max_context_files": 10,
     "auto_commit": False,
@@ -129,7 +134,7 @@ class Config:
         if os.path.exists(self.config_path):
             try:
                 with open(self.config_path, "r") as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml.load(f, Loader=_SafeLoader) or {}
                 return self._merge_config(DEFAULT_CONFIG, user_config)
             except Exception as e:
                 print(f"Warning: Could not load config.yaml: {e}")
@@ -111,6 +111,9 @@ class SharedContextWindow:
         self.max_tokens = max_tokens
         self.total_tokens = 0
         self.providers_used: Dict[str, int] = {}  # Track provider usage
+        # Cached openai-format view; reused across get_messages calls until
+        # the underlying message list changes (see _invalidate_views)
+        self._openai_view: Optional[List[Dict[str, str]]] = None
 
     def add_message(
         self,
@@ -135,6 +138,7 @@ class SharedContextWindow:
         """
         message = ContextMessage(role, content, provider, model, metadata)
         self.messages.append(message)
+        self._invalidate_views()
 
         # Track provider usage
         if provider:
@@ -170,6 +174,17 @@ class SharedContextWindow:
         """
         messages = self.messages
 
+        # Fast path: the plain openai-format view is what ProviderRouter
+        # requests on every complete() call, so reuse the cached list instead
+        # of rebuilding O(N) message dicts each time.
+        cacheable = (
+            format == "openai"
+            and provider_filter is None
+            and include_provider_attribution
+        )
+        if cacheable and self._openai_view is not None:
+            return self._openai_view
+
         # Filter by provider if requested
         if provider_filter:
             messages = [m for m in messages if m.provider == provider_filter]
@@ -187,6 +202,8 @@ class SharedContextWindow:
                     attribution += "]\n\n"
                     msg["content"] = attribution + msg["content"]
                 result.append(msg)
+            if cacheable:
+                self._openai_view = result
             return result
         elif format == "full":
             return [m.to_dict() for m in messages]
@@ -214,6 +231,10 @@ class SharedContextWindow:
             "newest_message": self.messages[-1].timestamp if self.messages else None
         }
 
+    def _invalidate_views(self):
+        """Drop cached message views after the message list changes"""
+        self._openai_view = None
+
     def _trim_if_needed(self):
         """Trim oldest messages if context exceeds max tokens"""
         while self.total_tokens > self.max_tokens and len(self.messages) > 1:
@@ -241,6 +262,7 @@ class SharedContextWindow:
 
         self.total_tokens = sum(len(m.content) // 4 for m in self.messages)
         self.providers_used = {}
+        self._invalidate_views()
 
     def save_to_file(self, filepath: str):
         """Save context window to JSON file"""
@@ -276,6 +298,8 @@ class SharedContextWindow:
             self.total_tokens = data["metadata"].get("total_tokens", 0)
             self.providers_used = data["metadata"].get("providers_used", {})
 
+        self._invalidate_views()
+
     def create_snapshot(self) -> Dict[str, Any]:
         """Create a snapshot of current context state"""
         return {
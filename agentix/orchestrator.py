@@ -457,6 +457,10 @@ Followed by a human-readable checklist."""
             # create_file or edit_file
             self._generate_and_write_file(task, target_path)
 
+        # Every action can mutate the tree (commands included), so the
+        # validator's cached directory listings are stale from here on
+        Validator.invalidate_fs_cache()
+
         # Mark task as completed
         ColoredOutput.success(f"✓ Task {task['id']} completed")
 
@@ -12,6 +12,11 @@ import yaml
 import json
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class PluginType(Enum):
     """Types of plugins supported by Agentix."""
@@ -117,7 +122,7 @@ class PluginManifest:
 
         with open(path, 'r') as f:
             if path.suffix in ['.yaml', '.yml']:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_SafeLoader)
             elif path.suffix == '.json':
                 data = json.load(f)
             else:
@@ -10,16 +10,34 @@ Supports unlimited AI providers:
 - ... and more!
 """
 
+import importlib
+
 from .base import AIProvider, ProviderCapability
-from .claude import ClaudeProvider
-from .openai import OpenAIProvider
-from .gemini import GeminiProvider
-from .openrouter import OpenRouterProvider
-from .ollama import OllamaProvider
-from .claude_cli import ClaudeCLIProvider
-from .openai_cli import OpenAICLIProvider
-from .gemini_cli import GeminiCLIProvider
-from .router import ProviderRouter
+
+# Provider modules import heavy SDKs (anthropic, openai, google.generativeai).
+# They are loaded lazily via PEP 562 module __getattr__ so that importing this
+# package (e.g., just to build a ProviderRouter) stays cheap.
+_LAZY_IMPORTS = {
+    "ClaudeProvider": ".claude",
+    "OpenAIProvider": ".openai",
+    "GeminiProvider": ".gemini",
+    "OpenRouterProvider": ".openrouter",
+    "OllamaProvider": ".ollama",
+    "ClaudeCLIProvider": ".claude_cli",
+    "OpenAICLIProvider": ".openai_cli",
+    "GeminiCLIProvider": ".gemini_cli",
+    "ProviderRouter": ".router",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "AIProvider",
@@ -9,21 +9,93 @@ OpenRouter's strengths:
 - Best for: Model experimentation, cost optimization, accessing niche models
 """
 
+import json
+import logging
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
 from .base import AIProvider, ProviderCapability
 
+logger = logging.getLogger(__name__)
+
+try:
+    # Optional speedup: orjson encodes/decodes large chat payloads several
+    # times faster than stdlib json. Fall back silently when unavailable.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _PoolFullCounter(logging.Filter):
+    """
+    Counts urllib3 'Connection pool is full' warnings for the OpenRouter host.
+
+    urllib3 silently discards (and later re-handshakes) connections when the
+    pool is undersized; surfacing a counter makes that churn visible. One
+    instance is installed on the urllib3.connectionpool logger for the whole
+    process: matching on the API host keeps churn from other urllib3 users
+    (a local Ollama, say) out of the count, and keeping the tally on the
+    filter itself - rather than a provider reference - means provider
+    instances stay collectable and filters don't accumulate per instance.
+    """
+
+    events = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        if "Connection pool is full" in message and "openrouter.ai" in message:
+            _PoolFullCounter.events += 1
+            if _PoolFullCounter.events == 1:
+                logger.warning(
+                    "OpenRouter connection pool exhausted - consider raising "
+                    "the 'concurrency' setting for the openrouter provider"
+                )
+        return True
+
+
+_pool_full_counter_installed = False
+
+
+def _install_pool_full_counter():
+    """Attach the shared counter filter once, on first provider init."""
+    global _pool_full_counter_installed
+    if not _pool_full_counter_installed:
+        logging.getLogger("urllib3.connectionpool").addFilter(_PoolFullCounter())
+        _pool_full_counter_installed = True
+
 
 class OpenRouterProvider(AIProvider):
     """OpenRouter AI provider - access to 100+ models"""
 
-    def __init__(self, api_key: Optional[str] = None, site_url: Optional[str] = None, site_name: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, site_url: Optional[str] = None,
+                 site_name: Optional[str] = None, concurrency: int = 10):
         super().__init__(api_key or os.getenv("OPENROUTER_API_KEY"))
         self.site_url = site_url or os.getenv("OPENROUTER_SITE_URL", "http://localhost:3000")
         self.site_name = site_name or os.getenv("OPENROUTER_SITE_NAME", "Agentix")
         self.api_base = "https://openrouter.ai/api/v1"
 
+        # Auth/referrer headers never change per-call, so set them once on a
+        # keep-alive Session instead of rebuilding a headers dict per request.
+        # The pool is sized to the expected fan-out (e.g. from complete_many)
+        # so concurrent calls don't churn through discarded connections.
+        self.concurrency = concurrency
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=concurrency,
+            pool_maxsize=concurrency * 2,
+            pool_block=False,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        _install_pool_full_counter()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": self.site_url,
+            "X-Title": self.site_name,
+            "Content-Type": "application/json",
+        })
+
     @property
     def name(self) -> str:
         return "openrouter"
@@ -64,13 +136,6 @@ class OpenRouterProvider(AIProvider):
         if not self.api_key:
             raise RuntimeError("OpenRouter API key not configured")
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "HTTP-Referer": self.site_url,
-            "X-Title": self.site_name,
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "model": model or self.default_model,
             "messages": messages,
@@ -79,15 +144,24 @@ class OpenRouterProvider(AIProvider):
             **kwargs
         }
 
+        # Content-Type is already set on the session headers, so the payload
+        # can be pre-serialized and sent as raw bytes.
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode("utf-8")
+
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_base}/chat/completions",
-                headers=headers,
-                json=payload,
+                data=body,
                 timeout=120
             )
             response.raise_for_status()
-            data = response.json()
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
             return data["choices"][0]["message"]["content"]
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"OpenRouter API error: {str(e)}")
@@ -96,19 +170,22 @@ class OpenRouterProvider(AIProvider):
         """Validate OpenRouter configuration"""
         return bool(self.api_key)
 
+    # Optimal model per task type from OpenRouter's catalog; built once at
+    # class creation instead of per get_optimal_model call
+    TASK_MODELS = {
+        "specification": "anthropic/claude-3.5-sonnet",
+        "planning": "anthropic/claude-3.5-sonnet",
+        "code_generation": "openai/gpt-4-turbo",
+        "task_execution": "google/gemini-pro-1.5",
+        "refactoring": "anthropic/claude-3.5-sonnet",
+        "review": "anthropic/claude-3.5-sonnet",
+        "fast_iteration": "google/gemini-flash-1.5",
+        "large_context": "google/gemini-pro-1.5",
+    }
+
     def get_optimal_model(self, task_type: str) -> str:
         """Get optimal model for task type from OpenRouter's catalog"""
-        task_models = {
-            "specification": "anthropic/claude-3.5-sonnet",
-            "planning": "anthropic/claude-3.5-sonnet",
-            "code_generation": "openai/gpt-4-turbo",
-            "task_execution": "google/gemini-pro-1.5",
-            "refactoring": "anthropic/claude-3.5-sonnet",
-            "review": "anthropic/claude-3.5-sonnet",
-            "fast_iteration": "google/gemini-flash-1.5",
-            "large_context": "google/gemini-pro-1.5",
-        }
-        return task_models.get(task_type, self.default_model)
+        return self.TASK_MODELS.get(task_type, self.default_model)
 
     def get_available_models(self) -> List[Dict[str, Any]]:
         """Get list of available models from OpenRouter"""
@@ -116,9 +193,8 @@ class OpenRouterProvider(AIProvider):
             return []
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.api_base}/models",
-                headers={"Authorization": f"Bearer {self.api_key}"},
                 timeout=30
             )
             response.raise_for_status()
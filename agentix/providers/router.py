@@ -9,16 +9,13 @@ Routes tasks to the optimal AI provider based on:
 - Availability
 """
 
+import importlib
+import logging
+import sys
 from typing import Dict, List, Optional, Any
 from .base import AIProvider, ProviderCapability
-from .claude import ClaudeProvider
-from .openai import OpenAIProvider
-from .gemini import GeminiProvider
-from .openrouter import OpenRouterProvider
-from .ollama import OllamaProvider
-from .claude_cli import ClaudeCLIProvider
-from .openai_cli import OpenAICLIProvider
-from .gemini_cli import GeminiCLIProvider
+
+logger = logging.getLogger(__name__)
 
 
 class ProviderRouter:
@@ -30,32 +27,50 @@ class ProviderRouter:
 
     # Best provider for each task type based on strengths
     # CLI providers are prioritized when available (use authenticated tools, no API keys needed)
+    # Stored as tuples of interned names: these tables are read on every
+    # dispatch, and interning makes the provider-dict lookups cheaper.
     TASK_PREFERENCES = {
-        "specification": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
-        "planning": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
-        "tasks": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
-        "code_generation": ["openai_cli", "openai", "gemini_cli", "ollama", "gemini", "claude_cli", "claude", "openrouter"],
-        "task_execution": ["gemini_cli", "gemini", "openai_cli", "ollama", "openai", "claude_cli", "claude", "openrouter"],
-        "refactoring": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
-        "review": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
-        "large_context": ["gemini_cli", "gemini", "claude_cli", "claude", "openrouter", "openai_cli", "openai", "ollama"],
-        "fast_iteration": ["gemini_cli", "gemini", "openai_cli", "ollama", "openai", "claude_cli", "claude", "openrouter"],
-        "cli": ["claude_cli", "openai_cli", "gemini_cli", "ollama"],  # Prefer CLI tools when requested
-        "cost_effective": ["claude_cli", "openai_cli", "gemini_cli", "ollama", "openrouter", "gemini", "openai", "claude"],
+        task: tuple(sys.intern(name) for name in names)
+        for task, names in {
+            "specification": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
+            "planning": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
+            "tasks": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
+            "code_generation": ["openai_cli", "openai", "gemini_cli", "ollama", "gemini", "claude_cli", "claude", "openrouter"],
+            "task_execution": ["gemini_cli", "gemini", "openai_cli", "ollama", "openai", "claude_cli", "claude", "openrouter"],
+            "refactoring": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
+            "review": ["claude_cli", "claude", "openai_cli", "openai", "gemini_cli", "gemini", "openrouter", "ollama"],
+            "large_context": ["gemini_cli", "gemini", "claude_cli", "claude", "openrouter", "openai_cli", "openai", "ollama"],
+            "fast_iteration": ["gemini_cli", "gemini", "openai_cli", "ollama", "openai", "claude_cli", "claude", "openrouter"],
+            "cli": ["claude_cli", "openai_cli", "gemini_cli", "ollama"],  # Prefer CLI tools when requested
+            "cost_effective": ["claude_cli", "openai_cli", "gemini_cli", "ollama", "openrouter", "gemini", "openai", "claude"],
+        }.items()
     }
 
-    # Map of provider names to their class constructors
+    # Fallback order for unknown task types (avoids allocating a new list
+    # on every get_provider call)
+    DEFAULT_PREFERENCES = ("openai", "claude", "gemini")
+
+    # Map of provider names to their import paths. Provider modules pull in
+    # heavy SDKs (anthropic, openai, google.generativeai, ...), so they are
+    # imported lazily - only when a provider is actually initialized.
     PROVIDER_CLASSES = {
-        "claude": ClaudeProvider,
-        "openai": OpenAIProvider,
-        "gemini": GeminiProvider,
-        "openrouter": OpenRouterProvider,
-        "ollama": OllamaProvider,
-        "claude_cli": ClaudeCLIProvider,
-        "openai_cli": OpenAICLIProvider,
-        "gemini_cli": GeminiCLIProvider,
+        "claude": "agentix.providers.claude:ClaudeProvider",
+        "openai": "agentix.providers.openai:OpenAIProvider",
+        "gemini": "agentix.providers.gemini:GeminiProvider",
+        "openrouter": "agentix.providers.openrouter:OpenRouterProvider",
+        "ollama": "agentix.providers.ollama:OllamaProvider",
+        "claude_cli": "agentix.providers.claude_cli:ClaudeCLIProvider",
+        "openai_cli": "agentix.providers.openai_cli:OpenAICLIProvider",
+        "gemini_cli": "agentix.providers.gemini_cli:GeminiCLIProvider",
     }
 
+    @staticmethod
+    def _load(import_path: str):
+        """Import and return a provider class from a 'module:ClassName' path."""
+        module_path, class_name = import_path.split(":")
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)
+
     def __init__(self, config: Optional[Dict[str, Any]] = None, shared_context: Optional[Any] = None):
         """
         Initialize provider router.
@@ -79,14 +94,16 @@ class ProviderRouter:
         providers_config = self.config.get("providers", {})
 
         # Dynamically initialize all known providers
-        for provider_name, ProviderClass in self.PROVIDER_CLASSES.items():
+        for provider_name, import_path in self.PROVIDER_CLASSES.items():
             provider_cfg = providers_config.get(provider_name, {})
 
-            # Skip if explicitly disabled
+            # Skip if explicitly disabled (before paying the import cost)
             if not provider_cfg.get("enabled", True):
                 continue
 
             try:
+                ProviderClass = self._load(import_path)
+
                 # Extract provider-specific config
                 api_key = provider_cfg.get("api_key")
 
@@ -95,7 +112,8 @@ class ProviderRouter:
                     provider = ProviderClass(
                         api_key=api_key,
                         site_url=provider_cfg.get("site_url"),
-                        site_name=provider_cfg.get("site_name")
+                        site_name=provider_cfg.get("site_name"),
+                        concurrency=provider_cfg.get("concurrency", 10)
                     )
                 elif provider_name == "ollama":
                     provider = ProviderClass(
@@ -110,12 +128,12 @@ class ProviderRouter:
                 # Validate and add if successful
                 if provider.validate_config():
                     self.providers[provider_name] = provider
-                    print(f"✓ Initialized {provider_name} provider")
+                    logger.info("Initialized %s provider", provider_name)
                 else:
-                    print(f"⚠ {provider_name} validation failed - skipping")
+                    logger.warning("%s validation failed - skipping", provider_name)
 
             except Exception as e:
-                print(f"⚠ Could not initialize {provider_name}: {e}")
+                logger.warning("Could not initialize %s: %s", provider_name, e)
 
         if not self.providers:
             raise RuntimeError(
@@ -158,7 +176,7 @@ class ProviderRouter:
         # Get preference order for this task type
         preference_order = self.TASK_PREFERENCES.get(
             task_type,
-            ["openai", "claude", "gemini"]
+            self.DEFAULT_PREFERENCES
         )
 
         # Try providers in preference order
@@ -225,7 +243,7 @@ class ProviderRouter:
             Tuple of (response_text, provider_name)
         """
         # If using shared context, add messages to it and get full context
-        if use_shared_context and self.shared_context:
+        if use_shared_context and self.shared_context is not None:
             # Add user messages to shared context
             for msg in messages:
                 if msg["role"] == "user":
@@ -263,7 +281,7 @@ class ProviderRouter:
         )
 
         # Add response to shared context if enabled
-        if use_shared_context and self.shared_context:
+        if use_shared_context and self.shared_context is not None:
             self.shared_context.add_message(
                 role="assistant",
                 content=response,
@@ -273,6 +291,35 @@ class ProviderRouter:
 
         return response, provider.name
 
+    def complete_many(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[tuple[str, str]]:
+        """
+        Get completions for many independent requests concurrently.
+
+        Each request is a dict of keyword arguments for complete()
+        (messages, task_type, model, ...). Requests are dispatched on a
+        thread pool, so I/O-bound provider calls overlap instead of
+        running back-to-back; provider instances (and their keep-alive
+        HTTP sessions) are shared across the batch.
+
+        Args:
+            requests: List of keyword-argument dicts for complete()
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of (response_text, provider_name) tuples in request order
+        """
+        if not requests:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(lambda r: self.complete(**r), requests))
+
     def get_available_providers(self) -> List[str]:
         """Get list of available provider names"""
         return list(self.providers.keys())
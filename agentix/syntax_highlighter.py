@@ -4,7 +4,11 @@ Provides comprehensive syntax highlighting for multiple programming languages
 using ANSI color codes for terminal display.
 """
 
+import os
 import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
@@ -162,15 +166,15 @@ class ColorTheme:
 class LanguageDefinition:
     """Language-specific syntax definitions."""
 
-    PYTHON_KEYWORDS = {
+    PYTHON_KEYWORDS = frozenset({
         'False', 'None', 'True', 'and', 'as', 'assert', 'async', 'await',
         'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'except',
         'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is',
         'lambda', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return',
         'try', 'while', 'with', 'yield'
-    }
+    })
 
-    PYTHON_BUILTINS = {
+    PYTHON_BUILTINS = frozenset({
         'abs', 'all', 'any', 'ascii', 'bin', 'bool', 'bytearray', 'bytes',
         'callable', 'chr', 'classmethod', 'compile', 'complex', 'delattr',
         'dict', 'dir', 'divmod', 'enumerate', 'eval', 'exec', 'filter',
@@ -181,9 +185,9 @@ class LanguageDefinition:
         'pow', 'print', 'property', 'range', 'repr', 'reversed', 'round',
         'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum',
         'super', 'tuple', 'type', 'vars', 'zip', '__import__', 'self', 'cls'
-    }
+    })
 
-    JAVASCRIPT_KEYWORDS = {
+    JAVASCRIPT_KEYWORDS = frozenset({
         'async', 'await', 'break', 'case', 'catch', 'class', 'const',
         'continue', 'debugger', 'default', 'delete', 'do', 'else', 'export',
         'extends', 'finally', 'for', 'function', 'if', 'import', 'in',
@@ -191,47 +195,47 @@ class LanguageDefinition:
         'this', 'throw', 'try', 'typeof', 'var', 'void', 'while', 'with',
         'yield', 'enum', 'implements', 'interface', 'package', 'private',
         'protected', 'public', 'from', 'of'
-    }
+    })
 
-    JAVASCRIPT_BUILTINS = {
+    JAVASCRIPT_BUILTINS = frozenset({
         'Array', 'Boolean', 'Date', 'Error', 'Function', 'JSON', 'Math',
         'Number', 'Object', 'Promise', 'RegExp', 'String', 'Symbol',
         'console', 'window', 'document', 'null', 'undefined', 'NaN',
         'Infinity', 'true', 'false'
-    }
+    })
 
-    GO_KEYWORDS = {
+    GO_KEYWORDS = frozenset({
         'break', 'case', 'chan', 'const', 'continue', 'default', 'defer',
         'else', 'fallthrough', 'for', 'func', 'go', 'goto', 'if', 'import',
         'interface', 'map', 'package', 'range', 'return', 'select', 'struct',
         'switch', 'type', 'var'
-    }
+    })
 
-    GO_BUILTINS = {
+    GO_BUILTINS = frozenset({
         'append', 'bool', 'byte', 'cap', 'close', 'complex', 'complex64',
         'complex128', 'copy', 'delete', 'error', 'false', 'float32', 'float64',
         'imag', 'int', 'int8', 'int16', 'int32', 'int64', 'len', 'make',
         'new', 'nil', 'panic', 'print', 'println', 'real', 'recover',
         'rune', 'string', 'true', 'uint', 'uint8', 'uint16', 'uint32',
         'uint64', 'uintptr'
-    }
+    })
 
-    RUST_KEYWORDS = {
+    RUST_KEYWORDS = frozenset({
         'as', 'async', 'await', 'break', 'const', 'continue', 'crate', 'dyn',
         'else', 'enum', 'extern', 'false', 'fn', 'for', 'if', 'impl', 'in',
         'let', 'loop', 'match', 'mod', 'move', 'mut', 'pub', 'ref', 'return',
         'self', 'Self', 'static', 'struct', 'super', 'trait', 'true', 'type',
         'unsafe', 'use', 'where', 'while'
-    }
+    })
 
-    RUST_BUILTINS = {
+    RUST_BUILTINS = frozenset({
         'bool', 'char', 'f32', 'f64', 'i8', 'i16', 'i32', 'i64', 'i128',
         'isize', 'str', 'u8', 'u16', 'u32', 'u64', 'u128', 'usize',
         'Box', 'String', 'Vec', 'Option', 'Result', 'Some', 'None',
         'Ok', 'Err', 'println', 'print', 'panic', 'assert', 'dbg'
-    }
+    })
 
-    SQL_KEYWORDS = {
+    SQL_KEYWORDS = frozenset({
         'SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE', 'CREATE',
         'DROP', 'ALTER', 'TABLE', 'INDEX', 'VIEW', 'JOIN', 'INNER', 'LEFT',
         'RIGHT', 'OUTER', 'ON', 'AS', 'AND', 'OR', 'NOT', 'IN', 'BETWEEN',
@@ -240,32 +244,149 @@ class LanguageDefinition:
         'PRIMARY', 'KEY', 'FOREIGN', 'REFERENCES', 'UNIQUE', 'DEFAULT',
         'AUTO_INCREMENT', 'VARCHAR', 'INT', 'FLOAT', 'DOUBLE', 'BOOLEAN',
         'DATE', 'DATETIME', 'TIMESTAMP', 'TEXT', 'BLOB'
+    })
+
+    # Built once at class creation; get_keywords/get_builtins used to
+    # rebuild these dicts on every call
+    _KEYWORD_MAP = {
+        'python': PYTHON_KEYWORDS,
+        'javascript': JAVASCRIPT_KEYWORDS,
+        'typescript': JAVASCRIPT_KEYWORDS,
+        'go': GO_KEYWORDS,
+        'rust': RUST_KEYWORDS,
+        'sql': SQL_KEYWORDS,
+    }
+
+    _BUILTIN_MAP = {
+        'python': PYTHON_BUILTINS,
+        'javascript': JAVASCRIPT_BUILTINS,
+        'typescript': JAVASCRIPT_BUILTINS,
+        'go': GO_BUILTINS,
+        'rust': RUST_BUILTINS,
     }
 
+    _EMPTY = frozenset()
+
     @classmethod
-    def get_keywords(cls, language: str) -> set:
+    def get_keywords(cls, language: str) -> frozenset:
         """Get keywords for a specific language."""
-        keyword_map = {
-            'python': cls.PYTHON_KEYWORDS,
-            'javascript': cls.JAVASCRIPT_KEYWORDS,
-            'typescript': cls.JAVASCRIPT_KEYWORDS,
-            'go': cls.GO_KEYWORDS,
-            'rust': cls.RUST_KEYWORDS,
-            'sql': cls.SQL_KEYWORDS,
-        }
-        return keyword_map.get(language.lower(), set())
+        return cls._KEYWORD_MAP.get(language.lower(), cls._EMPTY)
 
     @classmethod
-    def get_builtins(cls, language: str) -> set:
+    def get_builtins(cls, language: str) -> frozenset:
         """Get built-in functions/types for a specific language."""
-        builtin_map = {
-            'python': cls.PYTHON_BUILTINS,
-            'javascript': cls.JAVASCRIPT_BUILTINS,
-            'typescript': cls.JAVASCRIPT_BUILTINS,
-            'go': cls.GO_BUILTINS,
-            'rust': cls.RUST_BUILTINS,
-        }
-        return builtin_map.get(language.lower(), set())
+        return cls._BUILTIN_MAP.get(language.lower(), cls._EMPTY)
+
+
+@dataclass(frozen=True)
+class _TokenPatterns:
+    """Precompiled regex patterns for one language's tokenizer."""
+    string: Optional[re.Pattern] = None
+    number: Optional[re.Pattern] = None
+    function: Optional[re.Pattern] = None
+    class_def: Optional[re.Pattern] = None
+    decorator: Optional[re.Pattern] = None
+    macro: Optional[re.Pattern] = None
+    variable: Optional[re.Pattern] = None
+    keyword: Optional[re.Pattern] = None
+    key: Optional[re.Pattern] = None
+    boolean: Optional[re.Pattern] = None
+    word: Optional[re.Pattern] = None
+
+
+# Shared sub-patterns
+_NUMBER = r'\b(\d+\.?\d*|\.\d+)\b'
+_WORD = r'\b(\w+)\b'
+
+# Patterns are compiled once at import time rather than per highlight call:
+# re's internal cache still hashes and locks on every re.sub/re.finditer
+# with a string pattern, which adds up over per-line invocations.
+#
+# For Python/JS/Go/Rust, all token classes are merged into a single
+# alternation walked once per line (see _scan_tokens); earlier alternatives
+# win, so strings shadow everything, definitions shadow plain words, etc.
+# This replaces 5-6 independent re.sub passes (each allocating a new result
+# string) and the __STRING_i__ placeholder round-trip.
+_DEF_NUMBER_WORD = (
+    r'|(?P<defkw>\b(?:{defkws}))(?P<defsp>\s+)(?P<defname>\w+)'
+    r'|(?P<number>\b(?:\d+\.?\d*|\.\d+)\b)'
+    r'|(?P<word>\b\w+\b)'
+)
+
+_PY_MASTER_RE = re.compile(
+    r'(?P<comment>#[^\n]*)'
+    r'|(?P<string>""".*?"""|\'\'\'.*?\'\'\'|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    r'|(?P<decorator>@\w+)'
+    + _DEF_NUMBER_WORD.format(defkws='def|class')
+)
+
+_JS_MASTER_RE = re.compile(
+    r'(?P<comment>//[^\n]*)'
+    r'|(?P<string>`(?:[^`\\\n]|\\.)*`|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    + _DEF_NUMBER_WORD.format(defkws=r'async\s+function|function|class')
+)
+
+_GO_MASTER_RE = re.compile(
+    r'(?P<comment>//[^\n]*)'
+    r'|(?P<string>`[^`\n]*`|"(?:[^"\\\n]|\\.)*")'
+    + _DEF_NUMBER_WORD.format(defkws='func')
+)
+
+_RUST_MASTER_RE = re.compile(
+    r'(?P<comment>//[^\n]*)'
+    r'|(?P<string>"(?:[^"\\\n]|\\.)*")'
+    r'|(?P<macro>\w+!)'
+    + _DEF_NUMBER_WORD.format(defkws='fn')
+)
+
+_BASH_MASTER_RE = re.compile(
+    r'(?P<string>"(?:[^"\\]|\\.)*"|\'[^\']*\')'
+    r'|(?P<variable>\$\{?\w+\}?)'
+    r'|(?P<keyword>\b(?:if|then|else|elif|fi|for|while|do|done|case|esac|function)\b)'
+)
+
+# SQL keywords are embedded case-insensitively in the master pattern, so
+# the scanner only ever stops on tokens that need color - no per-word
+# str.upper() and no matches on plain identifiers
+_SQL_MASTER_RE = re.compile(
+    r'(?P<string>\'(?:[^\'\\]|\\.)*\')'
+    r'|(?P<number>\b(?:\d+\.?\d*|\.\d+)\b)'
+    r'|(?P<keyword>\b(?i:'
+    + '|'.join(sorted(LanguageDefinition.SQL_KEYWORDS, key=len, reverse=True))
+    + r')\b)'
+)
+
+# JSON is scanned with a single alternation like the code languages: a
+# string followed by ':' is an object key, any other string is a value
+_JSON_MASTER_RE = re.compile(
+    r'(?P<key>"(?:[^"\\]|\\.)*")(?=\s*:)'
+    r'|(?P<string>"(?:[^"\\]|\\.)*")'
+    r'|(?P<number>-?\b(?:\d+\.?\d*|\.\d+)\b)'
+    r'|(?P<boolean>\b(?:true|false|null)\b)'
+)
+
+_YAML_PATTERNS = _TokenPatterns(
+    key=re.compile(r'^(\s*)(\w[\w\s\-]*):(.*)$'),
+    string=re.compile(r'(\'[^\']*\'|"(?:[^"\\]|\\.)*")'),
+    number=re.compile(_NUMBER),
+    boolean=re.compile(r'\b(true|false|yes|no|null)\b'),
+)
+
+_GENERIC_PATTERNS = _TokenPatterns(
+    string=re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'),
+    number=re.compile(_NUMBER),
+)
+
+# Every token the master regexes can match contains a word character,
+# quote, or '@'; lines without any (blank, pure punctuation/brackets)
+# can skip tokenization entirely
+_INTERESTING_RE = re.compile(r'[\w"\'@]')
+
+# Whole-buffer span patterns: triple-quoted strings and C-style block
+# comments are found with one DOTALL scan over the full source instead of
+# tracking open/close state line by line
+_PY_MULTILINE_RE = re.compile(r'""".*?"""|\'\'\'.*?\'\'\'', re.DOTALL)
+_C_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
 
 
 class SyntaxHighlighter:
@@ -274,9 +395,47 @@ class SyntaxHighlighter:
     Tokenizes and colorizes source code for terminal display.
     """
 
-    def __init__(self, theme: ColorScheme = ColorScheme.DARK):
-        """Initialize the syntax highlighter with a color theme."""
+    def __init__(self, theme: ColorScheme = ColorScheme.DARK,
+                 force_color: Optional[bool] = None):
+        """
+        Initialize the syntax highlighter with a color theme.
+
+        Args:
+            theme: Color scheme to use
+            force_color: Force colors on/off; by default colors are only
+                emitted when stdout is a TTY and NO_COLOR is not set
+        """
         self.theme = theme
+        # ANSI codes are garbage when output is piped; checking once here
+        # avoids an isatty syscall per highlight call and lets highlight()
+        # skip all tokenization work in non-interactive runs
+        if force_color is None:
+            self._color_enabled = (
+                sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+            )
+        else:
+            self._color_enabled = force_color
+        # _colorize runs once per token, so resolve the theme's color table
+        # once here and pre-pair each color with the reset suffix; the hot
+        # path is then two lookups and one concatenation
+        colors = ColorTheme.THEMES.get(theme, ColorTheme.THEMES[ColorScheme.DARK])
+        reset = ANSIColors.RESET
+        self._wrap = {
+            token_type: (color, reset)
+            for token_type, color in colors.items()
+        }
+        self._default_wrap = (ANSIColors.WHITE, reset)
+        # Hot tokens ('def', 'self', 'return', ...) get wrapped in identical
+        # escape sequences thousands of times per file; memoize the wrapping
+        # per instance (the theme is fixed for an instance's lifetime)
+        self._colorize = lru_cache(maxsize=8192)(self._colorize)
+        # One map per language caching word -> fully colorized replacement;
+        # turns the keyword/builtin double set lookup into one dict.get
+        self._word_color_map = lru_cache(maxsize=None)(self._word_color_map)
+        # Re-rendering the same buffer (scroll, redraw) is common, so
+        # finished outputs are memoized per instance; highlight() bypasses
+        # this for very large buffers to bound cache memory
+        self._highlight_cached = lru_cache(maxsize=256)(self._highlight_uncached)
         self.language_map = {
             '.py': 'python',
             '.js': 'javascript',
@@ -304,13 +463,35 @@ class SyntaxHighlighter:
             '.css': 'css',
             '.md': 'markdown',
         }
+        # Built once per instance; highlight() used to rebuild this dict
+        # (and nine bound methods) on every call
+        self._highlighters = {
+            'python': self._highlight_python,
+            'javascript': self._highlight_javascript,
+            'typescript': self._highlight_javascript,
+            'go': self._highlight_go,
+            'rust': self._highlight_rust,
+            'bash': self._highlight_bash,
+            'sql': self._highlight_sql,
+            'json': self._highlight_json,
+            'yaml': self._highlight_yaml,
+        }
+        # Languages with a streaming tokenizer (see highlight_iter); the
+        # rest fall back to yielding the fully highlighted buffer
+        self._iter_highlighters = {
+            'python': self._iter_python,
+            'javascript': self._iter_javascript,
+            'typescript': self._iter_javascript,
+            'go': self._iter_go,
+            'rust': self._iter_rust,
+        }
 
     def detect_language(self, filename: str) -> Optional[str]:
         """Detect programming language from filename."""
-        for ext, lang in self.language_map.items():
-            if filename.lower().endswith(ext):
-                return lang
-        return None
+        # language_map is keyed by extension, so a single hashed lookup
+        # beats scanning every extension with endswith
+        _, ext = os.path.splitext(filename)
+        return self.language_map.get(ext.lower())
 
     def highlight(self, code: str, language: Optional[str] = None) -> str:
         """
@@ -323,472 +504,218 @@ class SyntaxHighlighter:
         Returns:
             Colorized code with ANSI escape sequences
         """
-        if not language:
+        if not self._color_enabled or not language:
             return code
 
-        # Route to language-specific highlighter
-        highlighter_map = {
-            'python': self._highlight_python,
-            'javascript': self._highlight_javascript,
-            'typescript': self._highlight_javascript,
-            'go': self._highlight_go,
-            'rust': self._highlight_rust,
-            'bash': self._highlight_bash,
-            'sql': self._highlight_sql,
-            'json': self._highlight_json,
-            'yaml': self._highlight_yaml,
-        }
+        if len(code) > 1_000_000:
+            return self._highlight_uncached(code, language)
+        return self._highlight_cached(code, language)
 
-        highlighter = highlighter_map.get(language.lower(), self._highlight_generic)
+    def _highlight_uncached(self, code: str, language: str) -> str:
+        """Route to the language-specific highlighter."""
+        highlighter = self._highlighters.get(language.lower(), self._highlight_generic)
         return highlighter(code)
 
-    def _colorize(self, text: str, token_type: TokenType) -> str:
-        """Apply color to text based on token type."""
-        color = ColorTheme.get_color(token_type, self.theme)
-        return f"{color}{text}{ANSIColors.RESET}"
+    def highlight_iter(self, code: str, language: Optional[str] = None):
+        """
+        Stream highlighted output as chunks instead of one string.
 
-    def _highlight_python(self, code: str) -> str:
-        """Highlight Python code."""
-        lines = code.split('\n')
-        highlighted_lines = []
-        in_multiline_string = False
-        multiline_delimiter = None
+        Languages with streaming tokenizers yield one chunk per span or
+        gap, keeping peak memory proportional to the largest chunk rather
+        than the whole output; other languages yield the highlighted
+        buffer in a single piece.
 
-        for line in lines:
-            if in_multiline_string:
-                if multiline_delimiter in line:
-                    # End of multiline string
-                    parts = line.split(multiline_delimiter, 1)
-                    highlighted_line = self._colorize(
-                        parts[0] + multiline_delimiter, TokenType.STRING
-                    )
-                    if len(parts) > 1:
-                        highlighted_line += self._highlight_python_line(parts[1])
-                    in_multiline_string = False
-                    multiline_delimiter = None
-                else:
-                    highlighted_line = self._colorize(line, TokenType.STRING)
-                highlighted_lines.append(highlighted_line)
-                continue
-
-            # Check for multiline string start
-            if '"""' in line or "'''" in line:
-                if '"""' in line:
-                    delimiter = '"""'
-                else:
-                    delimiter = "'''"
-
-                parts = line.split(delimiter)
-                if len(parts) >= 3:  # Complete multiline string on one line
-                    highlighted_line = parts[0]
-                    highlighted_line += self._colorize(
-                        delimiter + parts[1] + delimiter, TokenType.STRING
-                    )
-                    if len(parts) > 2:
-                        highlighted_line += self._highlight_python_line(parts[2])
-                else:  # Start of multiline string
-                    highlighted_line = self._highlight_python_line(parts[0])
-                    highlighted_line += self._colorize(delimiter + parts[1], TokenType.STRING)
-                    in_multiline_string = True
-                    multiline_delimiter = delimiter
-                highlighted_lines.append(highlighted_line)
-            else:
-                highlighted_lines.append(self._highlight_python_line(line))
+        Args:
+            code: Source code to highlight
+            language: Programming language (no highlighting if None)
 
-        return '\n'.join(highlighted_lines)
+        Yields:
+            Colorized chunks of the input
+        """
+        if not self._color_enabled or not language:
+            yield code
+            return
 
-    def _highlight_python_line(self, line: str) -> str:
-        """Highlight a single line of Python code."""
-        # Handle comments
-        if '#' in line:
-            parts = line.split('#', 1)
-            return (
-                self._highlight_python_tokens(parts[0]) +
-                self._colorize('#' + parts[1], TokenType.COMMENT)
-            )
+        iterator = self._iter_highlighters.get(language.lower())
+        if iterator is not None:
+            yield from iterator(code)
+        else:
+            yield self.highlight(code, language)
 
-        return self._highlight_python_tokens(line)
+    def _colorize(self, text: str, token_type: TokenType) -> str:
+        """Apply color to text based on token type."""
+        prefix, suffix = self._wrap.get(token_type, self._default_wrap)
+        return prefix + text + suffix
 
-    def _highlight_python_tokens(self, line: str) -> str:
-        """Tokenize and highlight Python code."""
-        # Regex patterns
-        string_pattern = r'(""".*?"""|\'\'\'.*?\'\'\'|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
-        decorator_pattern = r'(@\w+)'
-        number_pattern = r'\b(\d+\.?\d*|\.\d+)\b'
-        function_pattern = r'\b(def)\s+(\w+)'
-        class_pattern = r'\b(class)\s+(\w+)'
-        word_pattern = r'\b(\w+)\b'
-
-        result = line
-
-        # Highlight strings first (to avoid highlighting keywords within strings)
-        strings = []
-        for match in re.finditer(string_pattern, line):
-            placeholder = f"__STRING_{len(strings)}__"
-            strings.append(self._colorize(match.group(0), TokenType.STRING))
-            result = result.replace(match.group(0), placeholder, 1)
-
-        # Highlight decorators
-        result = re.sub(
-            decorator_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.DECORATOR),
-            result
-        )
+    def _recolor(self, pattern: re.Pattern, text: str,
+                 token_type: TokenType, prefix: str = '') -> str:
+        """
+        Colorize every capture of a single-group pattern via split parity.
 
-        # Highlight function definitions
-        result = re.sub(
-            function_pattern,
-            lambda m: (
-                self._colorize(m.group(1), TokenType.KEYWORD) + ' ' +
-                self._colorize(m.group(2), TokenType.FUNCTION)
-            ),
-            result
-        )
+        pattern.split puts the captured matches at the odd indices, so a
+        slice-assigned list comprehension recolors them all without the
+        per-match Python callback that re.sub(lambda ...) costs.
+        """
+        parts = pattern.split(text)
+        if len(parts) == 1:
+            return text
+        colorize = self._colorize
+        parts[1::2] = [prefix + colorize(m, token_type) for m in parts[1::2]]
+        return ''.join(parts)
+
+    def _word_color_map(self, language: str) -> Dict[str, str]:
+        """Build a word -> colorized-replacement map for a language."""
+        colorize = self._colorize
+        mapping = {
+            word: colorize(word, TokenType.KEYWORD)
+            for word in LanguageDefinition.get_keywords(language)
+        }
+        # Keywords win when a word appears in both sets
+        for word in LanguageDefinition.get_builtins(language):
+            if word not in mapping:
+                mapping[word] = colorize(word, TokenType.BUILTIN)
+        return mapping
 
-        # Highlight class definitions
-        result = re.sub(
-            class_pattern,
-            lambda m: (
-                self._colorize(m.group(1), TokenType.KEYWORD) + ' ' +
-                self._colorize(m.group(2), TokenType.CLASS)
-            ),
-            result
-        )
+    def _highlight_python(self, code: str) -> str:
+        """Highlight Python code."""
+        return ''.join(self._iter_python(code))
 
-        # Highlight numbers
-        result = re.sub(
-            number_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.NUMBER),
-            result
+    def _iter_python(self, code: str):
+        """Stream highlighted Python code chunk by chunk."""
+        return self._iter_spans(
+            code, _PY_MULTILINE_RE, TokenType.STRING,
+            self._highlight_python_tokens, ('"""', "'''")
         )
 
-        # Highlight keywords and builtins
-        keywords = LanguageDefinition.get_keywords('python')
-        builtins = LanguageDefinition.get_builtins('python')
-
-        def highlight_word(match):
-            word = match.group(0)
-            if word in keywords:
-                return self._colorize(word, TokenType.KEYWORD)
-            elif word in builtins:
-                return self._colorize(word, TokenType.BUILTIN)
-            return word
-
-        result = re.sub(word_pattern, highlight_word, result)
+    def _iter_spans(self, code, span_re, span_type, highlight_gap, openers):
+        """
+        Colorize multiline spans (triple-quoted strings, block comments)
+        with one whole-buffer scan, tokenizing the gaps between them.
+
+        Yields highlighted chunks as they are produced, so callers can
+        stream them instead of materializing the whole output. Gaps are
+        fed to the master tokenizer whole - line comments stop at newline
+        inside the pattern itself, so no line splitting is needed. An
+        opener with no matching closer runs to the end of the buffer,
+        mirroring the old per-line state machine.
+        """
+        colorize = self._colorize
+        pos = 0
+        for m in span_re.finditer(code):
+            yield highlight_gap(code[pos:m.start()])
+            yield colorize(m.group(), span_type)
+            pos = m.end()
+
+        tail = code[pos:]
+        opens = [i for i in (tail.find(o) for o in openers) if i != -1]
+        if opens:
+            idx = min(opens)
+            yield highlight_gap(tail[:idx])
+            yield colorize(tail[idx:], span_type)
+        else:
+            yield highlight_gap(tail)
+
+    def _scan_tokens(self, line: str, master: re.Pattern, language: str) -> str:
+        """
+        Highlight one line with a single pass of a combined token regex.
 
-        # Restore strings
-        for i, string in enumerate(strings):
-            result = result.replace(f"__STRING_{i}__", string, 1)
+        The master pattern's named groups identify the token class; class
+        keywords color the definition name as CLASS, all other definition
+        keywords color it as FUNCTION. Plain text between matches is
+        emitted unchanged.
+        """
+        # Blank and punctuation-only lines are common in real source;
+        # return them untouched without running the master regex
+        if not _INTERESTING_RE.search(line):
+            return line
+
+        word_map = self._word_color_map(language)
+        colorize = self._colorize
+
+        out = []
+        out_append = out.append
+        pos = 0
+        for m in master.finditer(line):
+            start = m.start()
+            if start > pos:
+                out_append(line[pos:start])
+            kind = m.lastgroup
+
+            if kind == 'word':
+                word = m.group()
+                out_append(word_map.get(word, word))
+            elif kind == 'defname':
+                defkw = m.group('defkw')
+                name_type = (
+                    TokenType.CLASS if defkw == 'class' else TokenType.FUNCTION
+                )
+                out_append(colorize(defkw, TokenType.KEYWORD))
+                out_append(m.group('defsp'))
+                out_append(colorize(m.group('defname'), name_type))
+            elif kind == 'comment':
+                out_append(colorize(m.group(), TokenType.COMMENT))
+            elif kind == 'string':
+                out_append(colorize(m.group(), TokenType.STRING))
+            elif kind == 'number':
+                out_append(colorize(m.group(), TokenType.NUMBER))
+            elif kind == 'decorator':
+                out_append(colorize(m.group(), TokenType.DECORATOR))
+            else:  # macro
+                out_append(colorize(m.group(), TokenType.FUNCTION))
+
+            pos = m.end()
+
+        out.append(line[pos:])
+        return ''.join(out)
 
-        return result
+    def _highlight_python_tokens(self, line: str) -> str:
+        """Tokenize and highlight Python code."""
+        return self._scan_tokens(line, _PY_MASTER_RE, 'python')
 
     def _highlight_javascript(self, code: str) -> str:
         """Highlight JavaScript/TypeScript code."""
-        lines = code.split('\n')
-        highlighted_lines = []
-        in_multiline_comment = False
-
-        for line in lines:
-            if in_multiline_comment:
-                if '*/' in line:
-                    parts = line.split('*/', 1)
-                    highlighted_line = self._colorize(parts[0] + '*/', TokenType.COMMENT)
-                    if len(parts) > 1:
-                        highlighted_line += self._highlight_javascript_line(parts[1])
-                    in_multiline_comment = False
-                else:
-                    highlighted_line = self._colorize(line, TokenType.COMMENT)
-                highlighted_lines.append(highlighted_line)
-                continue
-
-            # Check for multiline comment start
-            if '/*' in line:
-                parts = line.split('/*', 1)
-                if '*/' in parts[1]:
-                    inner_parts = parts[1].split('*/', 1)
-                    highlighted_line = self._highlight_javascript_line(parts[0])
-                    highlighted_line += self._colorize('/*' + inner_parts[0] + '*/', TokenType.COMMENT)
-                    highlighted_line += self._highlight_javascript_line(inner_parts[1])
-                else:
-                    highlighted_line = self._highlight_javascript_line(parts[0])
-                    highlighted_line += self._colorize('/*' + parts[1], TokenType.COMMENT)
-                    in_multiline_comment = True
-                highlighted_lines.append(highlighted_line)
-            else:
-                highlighted_lines.append(self._highlight_javascript_line(line))
-
-        return '\n'.join(highlighted_lines)
-
-    def _highlight_javascript_line(self, line: str) -> str:
-        """Highlight a single line of JavaScript code."""
-        # Handle single-line comments
-        if '//' in line:
-            parts = line.split('//', 1)
-            return (
-                self._highlight_javascript_tokens(parts[0]) +
-                self._colorize('//' + parts[1], TokenType.COMMENT)
-            )
+        return ''.join(self._iter_javascript(code))
 
-        return self._highlight_javascript_tokens(line)
+    def _iter_javascript(self, code: str):
+        """Stream highlighted JavaScript/TypeScript code chunk by chunk."""
+        return self._iter_spans(
+            code, _C_COMMENT_RE, TokenType.COMMENT,
+            self._highlight_javascript_tokens, ('/*',)
+        )
 
     def _highlight_javascript_tokens(self, line: str) -> str:
         """Tokenize and highlight JavaScript code."""
-        string_pattern = r'(`(?:[^`\\]|\\.)*`|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
-        number_pattern = r'\b(\d+\.?\d*|\.\d+)\b'
-        function_pattern = r'\b(function|async\s+function)\s+(\w+)'
-        class_pattern = r'\b(class)\s+(\w+)'
-        word_pattern = r'\b(\w+)\b'
-
-        result = line
-
-        # Highlight strings
-        strings = []
-        for match in re.finditer(string_pattern, line):
-            placeholder = f"__STRING_{len(strings)}__"
-            strings.append(self._colorize(match.group(0), TokenType.STRING))
-            result = result.replace(match.group(0), placeholder, 1)
-
-        # Highlight function definitions
-        result = re.sub(
-            function_pattern,
-            lambda m: (
-                self._colorize(m.group(1), TokenType.KEYWORD) + ' ' +
-                self._colorize(m.group(2), TokenType.FUNCTION)
-            ),
-            result
-        )
-
-        # Highlight class definitions
-        result = re.sub(
-            class_pattern,
-            lambda m: (
-                self._colorize(m.group(1), TokenType.KEYWORD) + ' ' +
-                self._colorize(m.group(2), TokenType.CLASS)
-            ),
-            result
-        )
-
-        # Highlight numbers
-        result = re.sub(
-            number_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.NUMBER),
-            result
-        )
-
-        # Highlight keywords and builtins
-        keywords = LanguageDefinition.get_keywords('javascript')
-        builtins = LanguageDefinition.get_builtins('javascript')
-
-        def highlight_word(match):
-            word = match.group(0)
-            if word in keywords:
-                return self._colorize(word, TokenType.KEYWORD)
-            elif word in builtins:
-                return self._colorize(word, TokenType.BUILTIN)
-            return word
-
-        result = re.sub(word_pattern, highlight_word, result)
-
-        # Restore strings
-        for i, string in enumerate(strings):
-            result = result.replace(f"__STRING_{i}__", string, 1)
-
-        return result
+        return self._scan_tokens(line, _JS_MASTER_RE, 'javascript')
 
     def _highlight_go(self, code: str) -> str:
         """Highlight Go code."""
-        lines = code.split('\n')
-        highlighted_lines = []
-        in_multiline_comment = False
-
-        for line in lines:
-            if in_multiline_comment:
-                if '*/' in line:
-                    parts = line.split('*/', 1)
-                    highlighted_line = self._colorize(parts[0] + '*/', TokenType.COMMENT)
-                    if len(parts) > 1:
-                        highlighted_line += self._highlight_go_line(parts[1])
-                    in_multiline_comment = False
-                else:
-                    highlighted_line = self._colorize(line, TokenType.COMMENT)
-                highlighted_lines.append(highlighted_line)
-                continue
-
-            if '/*' in line:
-                parts = line.split('/*', 1)
-                if '*/' in parts[1]:
-                    inner_parts = parts[1].split('*/', 1)
-                    highlighted_line = self._highlight_go_line(parts[0])
-                    highlighted_line += self._colorize('/*' + inner_parts[0] + '*/', TokenType.COMMENT)
-                    highlighted_line += self._highlight_go_line(inner_parts[1])
-                else:
-                    highlighted_line = self._highlight_go_line(parts[0])
-                    highlighted_line += self._colorize('/*' + parts[1], TokenType.COMMENT)
-                    in_multiline_comment = True
-                highlighted_lines.append(highlighted_line)
-            else:
-                highlighted_lines.append(self._highlight_go_line(line))
+        return ''.join(self._iter_go(code))
 
-        return '\n'.join(highlighted_lines)
-
-    def _highlight_go_line(self, line: str) -> str:
-        """Highlight a single line of Go code."""
-        if '//' in line:
-            parts = line.split('//', 1)
-            return (
-                self._highlight_go_tokens(parts[0]) +
-                self._colorize('//' + parts[1], TokenType.COMMENT)
-            )
-        return self._highlight_go_tokens(line)
+    def _iter_go(self, code: str):
+        """Stream highlighted Go code chunk by chunk."""
+        return self._iter_spans(
+            code, _C_COMMENT_RE, TokenType.COMMENT,
+            self._highlight_go_tokens, ('/*',)
+        )
 
     def _highlight_go_tokens(self, line: str) -> str:
         """Tokenize and highlight Go code."""
-        string_pattern = r'(`[^`]*`|"(?:[^"\\]|\\.)*")'
-        number_pattern = r'\b(\d+\.?\d*|\.\d+)\b'
-        function_pattern = r'\b(func)\s+(\w+)'
-        word_pattern = r'\b(\w+)\b'
-
-        result = line
-
-        strings = []
-        for match in re.finditer(string_pattern, line):
-            placeholder = f"__STRING_{len(strings)}__"
-            strings.append(self._colorize(match.group(0), TokenType.STRING))
-            result = result.replace(match.group(0), placeholder, 1)
-
-        result = re.sub(
-            function_pattern,
-            lambda m: (
-                self._colorize(m.group(1), TokenType.KEYWORD) + ' ' +
-                self._colorize(m.group(2), TokenType.FUNCTION)
-            ),
-            result
-        )
-
-        result = re.sub(
-            number_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.NUMBER),
-            result
-        )
-
-        keywords = LanguageDefinition.get_keywords('go')
-        builtins = LanguageDefinition.get_builtins('go')
-
-        def highlight_word(match):
-            word = match.group(0)
-            if word in keywords:
-                return self._colorize(word, TokenType.KEYWORD)
-            elif word in builtins:
-                return self._colorize(word, TokenType.BUILTIN)
-            return word
-
-        result = re.sub(word_pattern, highlight_word, result)
-
-        for i, string in enumerate(strings):
-            result = result.replace(f"__STRING_{i}__", string, 1)
-
-        return result
+        return self._scan_tokens(line, _GO_MASTER_RE, 'go')
 
     def _highlight_rust(self, code: str) -> str:
         """Highlight Rust code."""
-        lines = code.split('\n')
-        highlighted_lines = []
-        in_multiline_comment = False
+        return ''.join(self._iter_rust(code))
 
-        for line in lines:
-            if in_multiline_comment:
-                if '*/' in line:
-                    parts = line.split('*/', 1)
-                    highlighted_line = self._colorize(parts[0] + '*/', TokenType.COMMENT)
-                    if len(parts) > 1:
-                        highlighted_line += self._highlight_rust_line(parts[1])
-                    in_multiline_comment = False
-                else:
-                    highlighted_line = self._colorize(line, TokenType.COMMENT)
-                highlighted_lines.append(highlighted_line)
-                continue
-
-            if '/*' in line:
-                parts = line.split('/*', 1)
-                if '*/' in parts[1]:
-                    inner_parts = parts[1].split('*/', 1)
-                    highlighted_line = self._highlight_rust_line(parts[0])
-                    highlighted_line += self._colorize('/*' + inner_parts[0] + '*/', TokenType.COMMENT)
-                    highlighted_line += self._highlight_rust_line(inner_parts[1])
-                else:
-                    highlighted_line = self._highlight_rust_line(parts[0])
-                    highlighted_line += self._colorize('/*' + parts[1], TokenType.COMMENT)
-                    in_multiline_comment = True
-                highlighted_lines.append(highlighted_line)
-            else:
-                highlighted_lines.append(self._highlight_rust_line(line))
-
-        return '\n'.join(highlighted_lines)
-
-    def _highlight_rust_line(self, line: str) -> str:
-        """Highlight a single line of Rust code."""
-        if '//' in line:
-            parts = line.split('//', 1)
-            return (
-                self._highlight_rust_tokens(parts[0]) +
-                self._colorize('//' + parts[1], TokenType.COMMENT)
-            )
-        return self._highlight_rust_tokens(line)
+    def _iter_rust(self, code: str):
+        """Stream highlighted Rust code chunk by chunk."""
+        return self._iter_spans(
+            code, _C_COMMENT_RE, TokenType.COMMENT,
+            self._highlight_rust_tokens, ('/*',)
+        )
 
     def _highlight_rust_tokens(self, line: str) -> str:
         """Tokenize and highlight Rust code."""
-        string_pattern = r'("(?:[^"\\]|\\.)*")'
-        number_pattern = r'\b(\d+\.?\d*|\.\d+)\b'
-        function_pattern = r'\b(fn)\s+(\w+)'
-        macro_pattern = r'(\w+!)'
-        word_pattern = r'\b(\w+)\b'
-
-        result = line
-
-        strings = []
-        for match in re.finditer(string_pattern, line):
-            placeholder = f"__STRING_{len(strings)}__"
-            strings.append(self._colorize(match.group(0), TokenType.STRING))
-            result = result.replace(match.group(0), placeholder, 1)
-
-        result = re.sub(
-            macro_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.FUNCTION),
-            result
-        )
-
-        result = re.sub(
-            function_pattern,
-            lambda m: (
-                self._colorize(m.group(1), TokenType.KEYWORD) + ' ' +
-                self._colorize(m.group(2), TokenType.FUNCTION)
-            ),
-            result
-        )
-
-        result = re.sub(
-            number_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.NUMBER),
-            result
-        )
-
-        keywords = LanguageDefinition.get_keywords('rust')
-        builtins = LanguageDefinition.get_builtins('rust')
-
-        def highlight_word(match):
-            word = match.group(0)
-            if word in keywords:
-                return self._colorize(word, TokenType.KEYWORD)
-            elif word in builtins:
-                return self._colorize(word, TokenType.BUILTIN)
-            return word
-
-        result = re.sub(word_pattern, highlight_word, result)
-
-        for i, string in enumerate(strings):
-            result = result.replace(f"__STRING_{i}__", string, 1)
-
-        return result
+        return self._scan_tokens(line, _RUST_MASTER_RE, 'rust')
 
     def _highlight_bash(self, code: str) -> str:
         """Highlight Bash/Shell code."""
@@ -805,44 +732,38 @@ class SyntaxHighlighter:
 
     def _highlight_bash_line(self, line: str) -> str:
         """Highlight a single line of Bash code."""
-        if '#' in line:
-            parts = line.split('#', 1)
-            return (
-                self._highlight_bash_tokens(parts[0]) +
-                self._colorize('#' + parts[1], TokenType.COMMENT)
-            )
-        return self._highlight_bash_tokens(line)
-
-    def _highlight_bash_tokens(self, line: str) -> str:
-        """Tokenize and highlight Bash code."""
-        string_pattern = r'("(?:[^"\\]|\\.)*"|\'[^\']*\')'
-        variable_pattern = r'(\$\{?\w+\}?)'
-        keyword_pattern = r'\b(if|then|else|elif|fi|for|while|do|done|case|esac|function)\b'
-
-        result = line
-
-        strings = []
-        for match in re.finditer(string_pattern, line):
-            placeholder = f"__STRING_{len(strings)}__"
-            strings.append(self._colorize(match.group(0), TokenType.STRING))
-            result = result.replace(match.group(0), placeholder, 1)
-
-        result = re.sub(
-            variable_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.VARIABLE),
-            result
+        head, sep, tail = line.partition('#')
+        if not sep:
+            return self._highlight_bash_tokens(line)
+        return (
+            self._highlight_bash_tokens(head) +
+            self._colorize('#' + tail, TokenType.COMMENT)
         )
 
-        result = re.sub(
-            keyword_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.KEYWORD),
-            result
-        )
-
-        for i, string in enumerate(strings):
-            result = result.replace(f"__STRING_{i}__", string, 1)
+    def _highlight_bash_tokens(self, line: str) -> str:
+        """Tokenize and highlight Bash code in one combined-regex pass."""
+        if not _INTERESTING_RE.search(line):
+            return line
+
+        colorize = self._colorize
+        out = []
+        out_append = out.append
+        pos = 0
+        for m in _BASH_MASTER_RE.finditer(line):
+            start = m.start()
+            if start > pos:
+                out_append(line[pos:start])
+            kind = m.lastgroup
+            if kind == 'string':
+                out_append(colorize(m.group(), TokenType.STRING))
+            elif kind == 'variable':
+                out_append(colorize(m.group(), TokenType.VARIABLE))
+            else:
+                out_append(colorize(m.group(), TokenType.KEYWORD))
+            pos = m.end()
 
-        return result
+        out_append(line[pos:])
+        return ''.join(out)
 
     def _highlight_sql(self, code: str) -> str:
         """Highlight SQL code."""
@@ -859,83 +780,62 @@ class SyntaxHighlighter:
 
     def _highlight_sql_line(self, line: str) -> str:
         """Highlight a single line of SQL code."""
-        if '--' in line:
-            parts = line.split('--', 1)
-            return (
-                self._highlight_sql_tokens(parts[0]) +
-                self._colorize('--' + parts[1], TokenType.COMMENT)
-            )
-        return self._highlight_sql_tokens(line)
-
-    def _highlight_sql_tokens(self, line: str) -> str:
-        """Tokenize and highlight SQL code."""
-        string_pattern = r'(\'(?:[^\'\\]|\\.)*\')'
-        number_pattern = r'\b(\d+\.?\d*|\.\d+)\b'
-
-        result = line
-
-        strings = []
-        for match in re.finditer(string_pattern, line):
-            placeholder = f"__STRING_{len(strings)}__"
-            strings.append(self._colorize(match.group(0), TokenType.STRING))
-            result = result.replace(match.group(0), placeholder, 1)
-
-        result = re.sub(
-            number_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.NUMBER),
-            result
+        head, sep, tail = line.partition('--')
+        if not sep:
+            return self._highlight_sql_tokens(line)
+        return (
+            self._highlight_sql_tokens(head) +
+            self._colorize('--' + tail, TokenType.COMMENT)
         )
 
-        keywords = LanguageDefinition.get_keywords('sql')
-        word_pattern = r'\b(\w+)\b'
-
-        def highlight_word(match):
-            word = match.group(0)
-            if word.upper() in keywords:
-                return self._colorize(word, TokenType.KEYWORD)
-            return word
-
-        result = re.sub(word_pattern, highlight_word, result)
-
-        for i, string in enumerate(strings):
-            result = result.replace(f"__STRING_{i}__", string, 1)
+    def _highlight_sql_tokens(self, line: str) -> str:
+        """Tokenize and highlight SQL code in one combined-regex pass."""
+        if not _INTERESTING_RE.search(line):
+            return line
+
+        colorize = self._colorize
+        out = []
+        out_append = out.append
+        pos = 0
+        for m in _SQL_MASTER_RE.finditer(line):
+            start = m.start()
+            if start > pos:
+                out_append(line[pos:start])
+            kind = m.lastgroup
+            if kind == 'string':
+                out_append(colorize(m.group(), TokenType.STRING))
+            elif kind == 'number':
+                out_append(colorize(m.group(), TokenType.NUMBER))
+            else:
+                out_append(colorize(m.group(), TokenType.KEYWORD))
+            pos = m.end()
 
-        return result
+        out_append(line[pos:])
+        return ''.join(out)
 
     def _highlight_json(self, code: str) -> str:
-        """Highlight JSON code."""
-        key_pattern = r'("[\w\s\-\_]+")(\s*:)'
-        string_pattern = r':\s*("(?:[^"\\]|\\.)*")'
-        number_pattern = r':\s*(\d+\.?\d*|\.\d+)'
-        boolean_pattern = r':\s*(true|false|null)'
-
-        result = code
-
-        result = re.sub(
-            key_pattern,
-            lambda m: self._colorize(m.group(1), TokenType.PROPERTY) + m.group(2),
-            result
-        )
-
-        result = re.sub(
-            string_pattern,
-            lambda m: ': ' + self._colorize(m.group(1), TokenType.STRING),
-            result
-        )
-
-        result = re.sub(
-            number_pattern,
-            lambda m: ': ' + self._colorize(m.group(1), TokenType.NUMBER),
-            result
-        )
-
-        result = re.sub(
-            boolean_pattern,
-            lambda m: ': ' + self._colorize(m.group(1), TokenType.KEYWORD),
-            result
-        )
-
-        return result
+        """Highlight JSON code in one combined-regex pass."""
+        colorize = self._colorize
+        out = []
+        out_append = out.append
+        pos = 0
+        for m in _JSON_MASTER_RE.finditer(code):
+            start = m.start()
+            if start > pos:
+                out_append(code[pos:start])
+            kind = m.lastgroup
+            if kind == 'key':
+                out_append(colorize(m.group(), TokenType.PROPERTY))
+            elif kind == 'string':
+                out_append(colorize(m.group(), TokenType.STRING))
+            elif kind == 'number':
+                out_append(colorize(m.group(), TokenType.NUMBER))
+            else:  # boolean / null
+                out_append(colorize(m.group(), TokenType.KEYWORD))
+            pos = m.end()
+
+        out_append(code[pos:])
+        return ''.join(out)
 
     def _highlight_yaml(self, code: str) -> str:
         """Highlight YAML code."""
@@ -952,22 +852,30 @@ class SyntaxHighlighter:
 
     def _highlight_yaml_line(self, line: str) -> str:
         """Highlight a single line of YAML code."""
-        if '#' in line:
-            parts = line.split('#', 1)
-            return (
-                self._highlight_yaml_tokens(parts[0]) +
-                self._colorize('#' + parts[1], TokenType.COMMENT)
-            )
-        return self._highlight_yaml_tokens(line)
+        head, sep, tail = line.partition('#')
+        if not sep:
+            return self._highlight_yaml_tokens(line)
+        return (
+            self._highlight_yaml_tokens(head) +
+            self._colorize('#' + tail, TokenType.COMMENT)
+        )
 
     def _highlight_yaml_tokens(self, line: str) -> str:
         """Tokenize and highlight YAML code."""
-        key_pattern = r'^(\s*)(\w[\w\s\-]*):(.*)$'
-        string_pattern = r'(\'[^\']*\'|"(?:[^"\\]|\\.)*")'
-        number_pattern = r'\b(\d+\.?\d*|\.\d+)\b'
-        boolean_pattern = r'\b(true|false|yes|no|null)\b'
+        if not _INTERESTING_RE.search(line):
+            return line
+
+        # A key line must start (after indent) with a word character, so a
+        # one-character test skips the key regex on list items, flow
+        # collections, block scalars and other pure-value lines
+        stripped = line.lstrip()
+        first = stripped[0]
+        if not (first.isalnum() or first == '_'):
+            return line
+
+        patterns = _YAML_PATTERNS
 
-        match = re.match(key_pattern, line)
+        match = patterns.key.match(line)
         if match:
             indent = match.group(1)
             key = match.group(2)
@@ -975,23 +883,9 @@ class SyntaxHighlighter:
 
             result = indent + self._colorize(key, TokenType.PROPERTY) + ':' + rest
 
-            result = re.sub(
-                string_pattern,
-                lambda m: self._colorize(m.group(0), TokenType.STRING),
-                result
-            )
-
-            result = re.sub(
-                number_pattern,
-                lambda m: self._colorize(m.group(0), TokenType.NUMBER),
-                result
-            )
-
-            result = re.sub(
-                boolean_pattern,
-                lambda m: self._colorize(m.group(0), TokenType.KEYWORD),
-                result
-            )
+            result = self._recolor(patterns.string, result, TokenType.STRING)
+            result = self._recolor(patterns.number, result, TokenType.NUMBER)
+            result = self._recolor(patterns.boolean, result, TokenType.KEYWORD)
 
             return result
 
@@ -999,26 +893,23 @@ class SyntaxHighlighter:
 
     def _highlight_generic(self, code: str) -> str:
         """Generic highlighting for unknown languages."""
-        string_pattern = r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
-        number_pattern = r'\b(\d+\.?\d*|\.\d+)\b'
-
+        patterns = _GENERIC_PATTERNS
         result = code
 
-        result = re.sub(
-            string_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.STRING),
-            result
-        )
-
-        result = re.sub(
-            number_pattern,
-            lambda m: self._colorize(m.group(0), TokenType.NUMBER),
-            result
-        )
+        result = self._recolor(patterns.string, result, TokenType.STRING)
+        result = self._recolor(patterns.number, result, TokenType.NUMBER)
 
         return result
 
 
+# One shared instance per theme: constructing a SyntaxHighlighter builds
+# dispatch tables and token caches worth reusing across calls, and the
+# instances hold no per-call state
+@lru_cache(maxsize=len(ColorScheme))
+def _get_highlighter(theme: ColorScheme) -> 'SyntaxHighlighter':
+    return SyntaxHighlighter(theme)
+
+
 # Convenience function for quick highlighting
 def highlight_code(code: str, language: Optional[str] = None,
                    theme: ColorScheme = ColorScheme.DARK) -> str:
@@ -1033,5 +924,4 @@ def highlight_code(code: str, language: Optional[str] = None,
     Returns:
         Colorized code with ANSI escape sequences
     """
-    highlighter = SyntaxHighlighter(theme)
-    return highlighter.highlight(code, language)
+    return _get_highlighter(theme).highlight(code, language)
@@ -7,6 +7,7 @@ This module defines the core abstractions for tools, including:
 - ToolResult: Standard result format for tool execution
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass, field
@@ -23,6 +24,18 @@ class ToolParameterType(Enum):
     ARRAY = "array"
 
 
+# Python types accepted for each parameter type, built once at import
+# instead of per validation call
+_TYPE_MAP = {
+    ToolParameterType.STRING: str,
+    ToolParameterType.INTEGER: int,
+    ToolParameterType.FLOAT: (int, float),
+    ToolParameterType.BOOLEAN: bool,
+    ToolParameterType.OBJECT: dict,
+    ToolParameterType.ARRAY: (list, tuple),
+}
+
+
 @dataclass
 class ToolParameter:
     """
@@ -48,7 +61,15 @@ class ToolParameter:
     items: Optional['ToolParameter'] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert parameter definition to dictionary format."""
+        """Convert parameter definition to dictionary format.
+
+        Parameter definitions are effectively immutable after construction,
+        so the dict is built once and reused on later calls.
+        """
+        cached = getattr(self, '_dict_cache', None)
+        if cached is not None:
+            return cached
+
         result = {
             "name": self.name,
             "type": self.type.value,
@@ -70,9 +91,25 @@ class ToolParameter:
         if self.items is not None:
             result["items"] = self.items.to_dict()
 
+        self._dict_cache = result
         return result
 
 
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry behavior for tools with transient failure modes.
+
+    Attributes:
+        max_attempts: Total attempts including the first call
+        backoff_base_ms: Base delay; attempt n waits ~base * 2**n plus jitter
+        retry_on: Exception types that trigger a retry
+    """
+    max_attempts: int = 3
+    backoff_base_ms: int = 100
+    retry_on: tuple = (TimeoutError, ConnectionError, OSError)
+
+
 @dataclass
 class ToolResult:
     """
@@ -107,6 +144,39 @@ class ToolResult:
         return result
 
 
+def _compile_validator(parameters: List['ToolParameter']):
+    """
+    Build a specialized parameter validator for one tool.
+
+    The parameter list is flattened into locals captured by the closure
+    (required names, and per-name (accepted types, enum) pairs), so a
+    validation call is straight dict probes with no attribute lookups
+    on ToolParameter objects. The registry attaches the result to each
+    tool at registration time.
+    """
+    required = tuple(p.name for p in parameters if p.required)
+    checks = {p.name: (_TYPE_MAP.get(p.type), p.enum) for p in parameters}
+
+    def validator(params: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+        for name in required:
+            if name not in params:
+                return False, f"Required parameter '{name}' is missing"
+
+        for name, value in params.items():
+            check = checks.get(name)
+            if check is None:
+                return False, f"Unknown parameter '{name}'"
+            expected, enum = check
+            if expected is not None and not isinstance(value, expected):
+                return False, f"Parameter '{name}' has invalid type"
+            if enum and value not in enum:
+                return False, f"Parameter '{name}' must be one of {enum}"
+
+        return True, None
+
+    return validator
+
+
 class Tool(ABC):
     """
     Abstract base class for all tools.
@@ -122,10 +192,38 @@ class Tool(ABC):
     - execute(): The actual tool logic
     """
 
+    # Tools that complete promptly can set this to run in the caller's
+    # thread, skipping the executor's per-call thread-pool hand-off (and
+    # with it, timeout enforcement)
+    supports_inline = False
+
+    # Idempotent tools can set cacheable so the executor reuses results
+    # for identical parameters; cache_ttl bounds the reuse window in
+    # seconds (None = no expiry)
+    cacheable = False
+    cache_ttl: Optional[int] = None
+
+    # Tools prone to transient failures (network hiccups, rate limits)
+    # can attach a RetryPolicy; the executor then retries matching
+    # exceptions in place instead of failing back to the agent loop
+    retry_policy: Optional[RetryPolicy] = None
+
+    # Long-running tools that accept a cancel_token keyword (a
+    # threading.Event checked in their inner loop) advertise it here;
+    # the executor sets the token on timeout so the tool can stop
+    # instead of occupying a pool worker forever
+    supports_cancel = False
+
     def __init__(self):
         """Initialize the tool."""
         self._validate_definition()
 
+        # Index the parameter list once so validation does dict lookups
+        # instead of scanning the list for every provided argument
+        params = self.parameters
+        self._param_index = {p.name: p for p in params}
+        self._required = tuple(p.name for p in params if p.required)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -157,6 +255,23 @@ class Tool(ABC):
         """
         pass
 
+    async def async_execute(self, **kwargs) -> ToolResult:
+        """
+        Execute the tool from an event loop.
+
+        The default implementation runs the synchronous execute on a
+        worker thread; tools with a native async client (HTTP-backed
+        MCP tools, for example) should override this with a real
+        coroutine so calls don't occupy a thread at all.
+
+        Args:
+            **kwargs: Tool parameters as keyword arguments
+
+        Returns:
+            ToolResult: Result of the tool execution
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+
     def _validate_definition(self):
         """Validate that the tool definition is correct."""
         if not self.name:
@@ -176,17 +291,15 @@ class Tool(ABC):
             Tuple of (is_valid, error_message)
         """
         # Check required parameters
-        for param in self.parameters:
-            if param.required and param.name not in params:
-                return False, f"Required parameter '{param.name}' is missing"
+        for name in self._required:
+            if name not in params:
+                return False, f"Required parameter '{name}' is missing"
 
         # Check parameter types (basic validation)
+        param_index = self._param_index
         for param_name, param_value in params.items():
             # Find parameter definition
-            param_def = next(
-                (p for p in self.parameters if p.name == param_name),
-                None
-            )
+            param_def = param_index.get(param_name)
 
             if param_def is None:
                 return False, f"Unknown parameter '{param_name}'"
@@ -203,16 +316,7 @@ class Tool(ABC):
 
     def _validate_type(self, value: Any, expected_type: ToolParameterType) -> bool:
         """Validate that a value matches the expected type."""
-        type_map = {
-            ToolParameterType.STRING: str,
-            ToolParameterType.INTEGER: int,
-            ToolParameterType.FLOAT: (int, float),
-            ToolParameterType.BOOLEAN: bool,
-            ToolParameterType.OBJECT: dict,
-            ToolParameterType.ARRAY: (list, tuple),
-        }
-
-        expected = type_map.get(expected_type)
+        expected = _TYPE_MAP.get(expected_type)
         if expected is None:
             return True
 
@@ -224,12 +328,18 @@ class Tool(ABC):
 
         This is useful for serialization and sending tool definitions
         to AI providers or MCP clients.
+
+        The result is built once and cached; tool definitions do not
+        change after construction.
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": [p.to_dict() for p in self.parameters],
-        }
+        cached = getattr(self, '_dict_cache', None)
+        if cached is None:
+            cached = self._dict_cache = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": [p.to_dict() for p in self.parameters],
+            }
+        return cached
 
     def __repr__(self) -> str:
         """String representation of the tool."""
@@ -242,5 +352,9 @@ class BuiltinTool(Tool):
 
     Built-in tools are always available and don't require
     external MCP servers.
+
+    Built-ins are quick local operations, so they run inline by default;
+    subclasses that may block (e.g. spawning subprocesses) opt back out.
     """
-    pass
+
+    supports_inline = True
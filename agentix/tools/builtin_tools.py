@@ -6,6 +6,8 @@ These tools are always available and don't require external MCP servers.
 
 import os
 import subprocess
+import threading
+from pathlib import Path
 from typing import List
 from .base import BuiltinTool, ToolParameter, ToolResult, ToolParameterType
 
@@ -13,6 +15,9 @@ from .base import BuiltinTool, ToolParameter, ToolResult, ToolParameterType
 class FileReadTool(BuiltinTool):
     """Read the contents of a file."""
 
+    # Refuse pathological inputs before allocating memory for them
+    max_bytes = 32 * 1024 * 1024
+
     @property
     def name(self) -> str:
         return "file_read"
@@ -44,8 +49,15 @@ class FileReadTool(BuiltinTool):
         encoding = kwargs.get("encoding", "utf-8")
 
         try:
-            with open(path, 'r', encoding=encoding) as f:
-                content = f.read()
+            size = os.stat(path).st_size
+            if size > self.max_bytes:
+                return ToolResult(
+                    success=False,
+                    error=f"File too large: {path} ({size} bytes, limit {self.max_bytes})"
+                )
+
+            # read_text fuses open/read/close without the extra Python layer
+            content = Path(path).read_text(encoding=encoding)
 
             return ToolResult(
                 success=True,
@@ -108,12 +120,15 @@ class FileWriteTool(BuiltinTool):
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
-            with open(path, 'w', encoding=encoding) as f:
-                f.write(content)
+            # Encode once and write the bytes; text mode would encode on
+            # write and then bytes_written would need a second full encode
+            encoded = content.encode(encoding)
+            with open(path, 'wb') as f:
+                f.write(encoded)
 
             return ToolResult(
                 success=True,
-                data={"path": path, "bytes_written": len(content.encode(encoding))},
+                data={"path": path, "bytes_written": len(encoded)},
             )
         except Exception as e:
             return ToolResult(
@@ -157,17 +172,22 @@ class FileListTool(BuiltinTool):
         recursive = kwargs.get("recursive", False)
 
         try:
+            # os.scandir hands back DirEntry objects with the full path and
+            # cached type info, avoiding the per-entry join + stat that
+            # os.walk/os.listdir would cost
+            files = []
             if recursive:
-                files = []
-                for root, dirs, filenames in os.walk(path):
-                    for filename in filenames:
-                        files.append(os.path.join(root, filename))
+                stack = [path]
+                while stack:
+                    with os.scandir(stack.pop()) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                files.append(entry.path)
             else:
-                files = [
-                    os.path.join(path, f)
-                    for f in os.listdir(path)
-                    if os.path.isfile(os.path.join(path, f))
-                ]
+                with os.scandir(path) as it:
+                    files = [e.path for e in it if e.is_file()]
 
             return ToolResult(
                 success=True,
@@ -188,6 +208,14 @@ class FileListTool(BuiltinTool):
 class ShellExecuteTool(BuiltinTool):
     """Execute a shell command."""
 
+    # Arbitrary commands can block indefinitely; keep the executor's
+    # pool-based timeout as a backstop
+    supports_inline = False
+
+    # Per-stream cap; output beyond this is read and discarded so the
+    # command is not blocked on a full pipe, but never held in memory
+    max_output_bytes = 1024 * 1024
+
     @property
     def name(self) -> str:
         return "shell_execute"
@@ -227,23 +255,58 @@ class ShellExecuteTool(BuiltinTool):
         timeout = kwargs.get("timeout", 30)
 
         try:
-            result = subprocess.run(
+            # Stream stdout/stderr into bounded buffers instead of letting
+            # capture_output buffer the whole output in memory; binary pipes
+            # are decoded exactly once at the end
+            proc = subprocess.Popen(
                 command,
                 shell=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd=working_dir,
-                timeout=timeout,
             )
 
-            return ToolResult(
-                success=result.returncode == 0,
+            limit = self.max_output_bytes
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            readers = [
+                threading.Thread(
+                    target=self._drain, args=(proc.stdout, stdout_buf, limit),
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._drain, args=(proc.stderr, stderr_buf, limit),
+                    daemon=True,
+                ),
+            ]
+            for reader in readers:
+                reader.start()
+
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                return ToolResult(
+                    success=False,
+                    error=f"Command timed out after {timeout} seconds"
+                )
+
+            for reader in readers:
+                reader.join()
+
+            truncated = len(stdout_buf) >= limit or len(stderr_buf) >= limit
+            result = ToolResult(
+                success=returncode == 0,
                 data={
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "returncode": result.returncode,
+                    "stdout": stdout_buf.decode(errors='replace'),
+                    "stderr": stderr_buf.decode(errors='replace'),
+                    "returncode": returncode,
                 },
             )
+            if truncated:
+                result.metadata["truncated"] = True
+            return result
         except subprocess.TimeoutExpired:
             return ToolResult(
                 success=False,
@@ -255,6 +318,18 @@ class ShellExecuteTool(BuiltinTool):
                 error=f"Error executing command: {str(e)}"
             )
 
+    @staticmethod
+    def _drain(stream, buf: bytearray, limit: int):
+        """Read a pipe to EOF, keeping at most ``limit`` bytes of it."""
+        read = stream.read
+        while True:
+            chunk = read(65536)
+            if not chunk:
+                return
+            room = limit - len(buf)
+            if room > 0:
+                buf.extend(chunk[:room])
+
 
 # List of all built-in tools
 BUILTIN_TOOLS = [
@@ -264,12 +339,17 @@ BUILTIN_TOOLS = [
     ShellExecuteTool,
 ]
 
+# Built-in tools are stateless, so one instance each is enough; constructing
+# (and re-validating) them per get_builtin_tools() call was wasted work
+_BUILTIN_INSTANCES = tuple(tool_class() for tool_class in BUILTIN_TOOLS)
+
 
 def get_builtin_tools() -> List[BuiltinTool]:
     """
     Get instances of all built-in tools.
 
     Returns:
-        List of built-in tool instances
+        List of built-in tool instances (shared singletons; the list
+        itself is a fresh copy each call)
     """
-    return [tool_class() for tool_class in BUILTIN_TOOLS]
+    return list(_BUILTIN_INSTANCES)
@@ -8,14 +8,110 @@ The executor provides:
 - Execution logging and metrics
 """
 
+import asyncio
+import copy
+import json
+import sys
 import time
+import random
 import logging
-from typing import Any, Dict, Optional
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from .base import Tool, ToolResult
 from .registry import ToolRegistry
 
 
+# Maximum number of cached results kept for tools marked cacheable
+_RESULT_CACHE_SIZE = 1024
+
+# Interned metadata keys: insertion into result.metadata reuses the
+# cached hash of the shared string object on every call
+_K_TOOL_NAME = sys.intern("tool_name")
+_K_EXEC_TIME = sys.intern("execution_time")
+_K_SOURCE = sys.intern("source")
+_K_ERROR_TYPE = sys.intern("error_type")
+
+# Shared read-only mapping for param-less calls; saves allocating a
+# fresh empty dict per execute() (nothing downstream mutates parameters)
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+class _AtomicCounter:
+    """
+    Lock-free increment counter for hot-path metrics.
+
+    next() on a C-level itertools.count is one atomic operation under
+    the GIL, so increments from pool workers need no lock (a plain
+    ``n += 1`` is three bytecodes and can lose updates under
+    contention). Reads advance the iterator too, so a second iterator
+    counts the reads and the difference recovers the value; concurrent
+    readers may observe the count off by one transiently, which is fine
+    for metrics.
+    """
+
+    __slots__ = ("_ticks", "_reads")
+
+    def __init__(self):
+        self._ticks = itertools.count()
+        self._reads = itertools.count()
+
+    def increment(self):
+        next(self._ticks)
+
+    def value(self) -> int:
+        return next(self._ticks) - next(self._reads)
+
+
+@dataclass(frozen=True)
+class ExecutorMetrics:
+    """
+    Immutable point-in-time snapshot of executor metrics.
+
+    Supports item access (metrics["success_rate"]) so existing callers
+    that treated get_metrics' dict as a mapping keep working without a
+    per-call dict copy.
+    """
+
+    __slots__ = (
+        "total_executions", "successful_executions", "failed_executions",
+        "retries", "total_time", "success_rate", "average_time",
+    )
+
+    total_executions: int
+    successful_executions: int
+    failed_executions: int
+    retries: int
+    total_time: float
+    success_rate: float
+    average_time: float
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+def _cache_key(tool_name: str, parameters: Dict[str, Any]):
+    """Build a hashable cache key for a tool call."""
+    try:
+        key = tool_name, tuple(sorted(parameters.items()))
+        # Sorting succeeds even when values are unhashable; probe the
+        # hash here so list/dict values (ARRAY and OBJECT parameters)
+        # take the fallback instead of blowing up at dict lookup time
+        hash(key)
+        return key
+    except TypeError:
+        # Unhashable parameter values fall back to a canonical JSON
+        # rendering
+        return tool_name, json.dumps(parameters, sort_keys=True, default=repr)
+
+
 class ToolExecutor:
     """
     Executor for running tools safely with timeouts and error handling.
@@ -42,14 +138,24 @@ class ToolExecutor:
 
         self._registry = registry or get_global_registry()
         self._default_timeout = default_timeout
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # The pool is created on first use: many executors (tests,
+        # short-lived agent turns, inline-only workloads) never submit
+        # anything, so don't pay for threads and a queue up front
+        self._max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
-        self._metrics = {
-            "total_executions": 0,
-            "successful_executions": 0,
-            "failed_executions": 0,
-            "total_time": 0.0,
-        }
+        # LRU result cache for tools that declare themselves cacheable
+        self._result_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Counters increment lock-free from worker threads; only the
+        # float time accumulator needs a lock
+        self._total = _AtomicCounter()
+        self._successful = _AtomicCounter()
+        self._failed = _AtomicCounter()
+        self._retries = _AtomicCounter()
+        self._total_time_ns = 0
+        self._time_lock = threading.Lock()
 
     def execute(self, tool_name: str, parameters: Optional[Dict[str, Any]] = None,
                 timeout: Optional[int] = None) -> ToolResult:
@@ -64,71 +170,285 @@ class ToolExecutor:
         Returns:
             ToolResult: Result of the execution
         """
-        start_time = time.time()
-        self._metrics["total_executions"] += 1
-        parameters = parameters or {}
+        start_ns = time.perf_counter_ns()
+        parameters = parameters if parameters else _EMPTY_PARAMS
+
+        # Idempotent tools short-circuit on a repeated call: a hit skips
+        # validation, submission and the tool body entirely
+        cache_key = None
+        cached_tool = self._registry.get(tool_name)
+        if cached_tool is not None and cached_tool.cacheable:
+            cache_key = _cache_key(tool_name, parameters)
+            hit = self._cache_get(cache_key)
+            if hit is not None:
+                return hit
+
+        tool, error = self._prepare(tool_name, parameters)
+        if error is not None:
+            return error
+
+        # Execute the tool
+        try:
+            result = self._execute_with_timeout(tool, parameters, timeout)
+            result = self._record(tool, tool_name, result, start_ns)
+            if cache_key is not None and result.success:
+                self._cache_put(cache_key, result, tool.cache_ttl)
+            return result
+
+        except Exception as e:
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            self._failed.increment()
+            with self._time_lock:
+                self._total_time_ns += elapsed_ns
+            execution_time = elapsed_ns / 1e9
+
+            self._logger.exception("Unexpected error executing tool '%s'", tool_name)
+            return ToolResult(
+                success=False,
+                error=f"Unexpected error: {str(e)}",
+                metadata={
+                    _K_TOOL_NAME: tool_name,
+                    _K_EXEC_TIME: execution_time,
+                    _K_ERROR_TYPE: type(e).__name__,
+                }
+            )
+
+    async def aexecute(self, tool_name: str,
+                       parameters: Optional[Dict[str, Any]] = None,
+                       timeout: Optional[int] = None) -> ToolResult:
+        """
+        Execute a tool from an event loop.
+
+        Async-native tools are awaited directly, so thousands of calls
+        can be in flight without max_workers becoming the bottleneck;
+        sync-only tools fall back to a worker thread via the default
+        Tool.async_execute.
+
+        Args:
+            tool_name: Name of the tool to execute
+            parameters: Dictionary of parameters to pass to the tool
+            timeout: Timeout in seconds (uses default if None)
+
+        Returns:
+            ToolResult: Result of the execution
+        """
+        start_ns = time.perf_counter_ns()
+        parameters = parameters if parameters else _EMPTY_PARAMS
+
+        cache_key = None
+        cached_tool = self._registry.get(tool_name)
+        if cached_tool is not None and cached_tool.cacheable:
+            cache_key = _cache_key(tool_name, parameters)
+            hit = self._cache_get(cache_key)
+            if hit is not None:
+                return hit
+
+        tool, error = self._prepare(tool_name, parameters)
+        if error is not None:
+            return error
+
+        try:
+            result = await asyncio.wait_for(
+                tool.async_execute(**parameters),
+                timeout=timeout or self._default_timeout,
+            )
+        except asyncio.TimeoutError:
+            timeout = timeout or self._default_timeout
+            self._failed.increment()
+            self._logger.error("Tool '%s' exceeded timeout of %ss", tool_name, timeout)
+            return ToolResult(
+                success=False,
+                error=f"Execution exceeded timeout of {timeout}s",
+                metadata={"timeout": timeout}
+            )
+        except Exception as e:
+            self._logger.exception("Error during tool execution: %s", e)
+            result = ToolResult(
+                success=False,
+                error=f"Execution error: {str(e)}",
+                metadata={_K_ERROR_TYPE: type(e).__name__}
+            )
+
+        result = self._record(tool, tool_name, result, start_ns)
+        if cache_key is not None and result.success:
+            self._cache_put(cache_key, result, tool.cache_ttl)
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first submission."""
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="tool-exec",
+                    )
+        return executor
+
+    def _prepare(self, tool_name: str,
+                 parameters: Dict[str, Any]) -> tuple[Optional[Tool], Optional[ToolResult]]:
+        """
+        Look up a tool and validate its parameters.
+
+        Returns:
+            (tool, None) when the call can proceed, or (None, error_result)
+            when lookup/validation failed
+        """
+        self._total.increment()
 
-        # Get the tool
         tool = self._registry.get(tool_name)
         if tool is None:
-            self._metrics["failed_executions"] += 1
-            self._logger.error(f"Tool '{tool_name}' not found in registry")
-            return ToolResult(
+            self._failed.increment()
+            self._logger.error("Tool '%s' not found in registry", tool_name)
+            return None, ToolResult(
                 success=False,
                 error=f"Tool '{tool_name}' not found",
             )
 
-        # Validate parameters
-        is_valid, error_msg = tool.validate_parameters(parameters)
+        # Zero-arg tools (status/ping/list style) are the most frequent
+        # callers; an empty call against one has nothing to validate
+        if not parameters and getattr(tool, "_no_params", False):
+            return tool, None
+
+        validator = getattr(tool, "_compiled_validator", None)
+        if validator is not None:
+            is_valid, error_msg = validator(parameters)
+        else:
+            is_valid, error_msg = tool.validate_parameters(parameters)
         if not is_valid:
-            self._metrics["failed_executions"] += 1
-            self._logger.error(f"Parameter validation failed for '{tool_name}': {error_msg}")
-            return ToolResult(
+            self._failed.increment()
+            self._logger.error("Parameter validation failed for '%s': %s", tool_name, error_msg)
+            return None, ToolResult(
                 success=False,
                 error=f"Parameter validation failed: {error_msg}",
             )
 
-        # Execute the tool
-        try:
-            result = self._execute_with_timeout(tool, parameters, timeout)
-            execution_time = time.time() - start_time
+        return tool, None
 
-            if result.success:
-                self._metrics["successful_executions"] += 1
-            else:
-                self._metrics["failed_executions"] += 1
-
-            self._metrics["total_time"] += execution_time
-
-            # Add execution metadata
-            result.metadata.update({
-                "tool_name": tool_name,
-                "execution_time": execution_time,
-                "source": self._registry.get_source(tool_name),
-            })
+    def _record(self, tool: Tool, tool_name: str, result: ToolResult,
+                start_ns: int) -> ToolResult:
+        """Update metrics, attach execution metadata, and log the outcome."""
+        # perf_counter_ns is monotonic (immune to NTP steps) and keeps
+        # the accumulator integer-only; seconds are derived once for the
+        # metadata and log line
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        execution_time = elapsed_ns / 1e9
 
+        if result.success:
+            self._successful.increment()
+        else:
+            self._failed.increment()
+        with self._time_lock:
+            self._total_time_ns += elapsed_ns
+
+        # Direct assignments skip the temporary dict that
+        # metadata.update({...}) would build per call
+        metadata = result.metadata
+        metadata[_K_TOOL_NAME] = tool_name
+        metadata[_K_EXEC_TIME] = execution_time
+        # Stamped onto the tool at registration; an attribute read
+        # beats a registry map query on every call
+        metadata[_K_SOURCE] = getattr(tool, "_source", None)
+
+        # Guard the format: at WARNING level (the production default)
+        # the f-string would be built per call only to be dropped
+        if self._logger.isEnabledFor(logging.INFO):
             self._logger.info(
-                f"Executed tool '{tool_name}' in {execution_time:.2f}s - "
-                f"{'success' if result.success else 'failed'}"
+                "Executed tool '%s' in %.2fs - %s",
+                tool_name, execution_time,
+                "success" if result.success else "failed",
             )
 
-            return result
+        return result
+
+    def _cache_get(self, key) -> Optional[ToolResult]:
+        """Return a copy of an unexpired cached result, or None."""
+        with self._cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            result, expiry = entry
+            if expiry is not None and time.time() >= expiry:
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+            # Copy so callers mutating the result (metadata updates,
+            # retries) can't corrupt the cached original
+            return copy.deepcopy(result)
+
+    def _cache_put(self, key, result: ToolResult, ttl: Optional[int]):
+        """Store a successful result, evicting the LRU entry when full."""
+        expiry = time.time() + ttl if ttl else None
+        with self._cache_lock:
+            self._result_cache[key] = (copy.deepcopy(result), expiry)
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def invalidate(self, tool_name: Optional[str] = None):
+        """
+        Drop cached results.
 
-        except Exception as e:
-            self._metrics["failed_executions"] += 1
-            execution_time = time.time() - start_time
-            self._metrics["total_time"] += execution_time
+        Args:
+            tool_name: If provided, only drop entries for this tool;
+                      otherwise clear the whole cache
+        """
+        with self._cache_lock:
+            if tool_name is None:
+                self._result_cache.clear()
+            else:
+                stale = [k for k in self._result_cache if k[0] == tool_name]
+                for k in stale:
+                    del self._result_cache[k]
 
-            self._logger.exception(f"Unexpected error executing tool '{tool_name}'")
-            return ToolResult(
-                success=False,
-                error=f"Unexpected error: {str(e)}",
-                metadata={
-                    "tool_name": tool_name,
-                    "execution_time": execution_time,
-                    "error_type": type(e).__name__,
-                }
-            )
+    def _call_tool(self, tool: Tool, parameters: Dict[str, Any]) -> ToolResult:
+        """
+        Invoke a tool in the calling thread, wrapping exceptions.
+
+        Tools with a RetryPolicy get their transient exceptions retried
+        here with exponential backoff and jitter, so the agent loop
+        never repays validation and submission for a hiccup. Only the
+        final attempt surfaces as a failed result.
+        """
+        policy = tool.retry_policy
+        attempts = policy.max_attempts if policy else 1
+        for attempt in range(attempts):
+            try:
+                return tool.execute(**parameters)
+            except Exception as e:
+                if (policy is not None
+                        and attempt + 1 < attempts
+                        and isinstance(e, policy.retry_on)):
+                    self._retries.increment()
+                    delay_ms = (policy.backoff_base_ms * 2 ** attempt
+                                + random.random() * policy.backoff_base_ms)
+                    self._logger.warning(
+                        "Tool '%s' failed (%s), retrying in %.0fms (attempt %d/%d)",
+                        tool.name, type(e).__name__, delay_ms,
+                        attempt + 1, attempts,
+                    )
+                    time.sleep(delay_ms / 1000)
+                    continue
+                self._logger.exception("Error during tool execution: %s", e)
+                return ToolResult(
+                    success=False,
+                    error=f"Execution error: {str(e)}",
+                    metadata={_K_ERROR_TYPE: type(e).__name__}
+                )
+
+    def _run(self, tool: Tool, tool_name: str,
+             parameters: Dict[str, Any]) -> ToolResult:
+        """
+        Run a validated tool in the calling thread.
+
+        Used by execute_batch, whose calls already run on pool workers -
+        hopping through _execute_with_timeout again would deadlock the
+        pool against itself.
+        """
+        start_ns = time.perf_counter_ns()
+        return self._record(tool, tool_name, self._call_tool(tool, parameters), start_ns)
 
     def _execute_with_timeout(self, tool: Tool, parameters: Dict[str, Any],
                               timeout: Optional[int]) -> ToolResult:
@@ -148,26 +468,46 @@ class ToolExecutor:
         """
         timeout = timeout or self._default_timeout
 
-        # Submit to executor
-        future = self._executor.submit(tool.execute, **parameters)
+        # Fast tools skip the pool entirely: the submit/wakeup/Future
+        # machinery costs more than the tool body, and such tools promise
+        # to return promptly so the timeout watchdog adds nothing
+        if tool.supports_inline:
+            return self._call_tool(tool, parameters)
+
+        # Cooperating tools take a cancel token so a timed-out body can
+        # actually stop; future.cancel() is a no-op once a task runs
+        cancel_token = None
+        if tool.supports_cancel:
+            cancel_token = threading.Event()
+            parameters = {**parameters, "cancel_token": cancel_token}
+
+        # Pass the params dict as one positional argument; **parameters
+        # would unpack it here only for submit to pack a kwargs dict again
+        future = self._get_executor().submit(self._call_tool, tool, parameters)
 
         try:
             result = future.result(timeout=timeout)
             return result
         except FutureTimeoutError:
-            future.cancel()
-            self._logger.error(f"Tool '{tool.name}' exceeded timeout of {timeout}s")
+            if cancel_token is not None:
+                # Signal the running body to wind down and release its
+                # worker; otherwise a timeout storm can silently pin
+                # every pool slot on stuck tools
+                cancel_token.set()
+            else:
+                future.cancel()
+            self._logger.error("Tool '%s' exceeded timeout of %ss", tool.name, timeout)
             return ToolResult(
                 success=False,
                 error=f"Execution exceeded timeout of {timeout}s",
                 metadata={"timeout": timeout}
             )
         except Exception as e:
-            self._logger.exception(f"Error during tool execution: {e}")
+            self._logger.exception("Error during tool execution: %s", e)
             return ToolResult(
                 success=False,
                 error=f"Execution error: {str(e)}",
-                metadata={"error_type": type(e).__name__}
+                metadata={_K_ERROR_TYPE: type(e).__name__}
             )
 
     def execute_batch(self, executions: list[tuple[str, Dict[str, Any]]],
@@ -182,43 +522,105 @@ class ToolExecutor:
         Returns:
             List of ToolResults in the same order as executions
         """
-        results = []
-        for tool_name, parameters in executions:
-            result = self.execute(tool_name, parameters, timeout)
-            results.append(result)
+        timeout = timeout or self._default_timeout
+
+        # Validate everything up front, then submit all runnable calls at
+        # once so I/O-bound tools overlap up to max_workers instead of
+        # serializing on one future.result() at a time. Batch items go
+        # through the same cache and inline fast paths as execute(), so
+        # a cacheable tool behaves identically either way
+        results: list[Optional[ToolResult]] = [None] * len(executions)
+        pending = []
+        for idx, (tool_name, parameters) in enumerate(executions):
+            parameters = parameters if parameters else _EMPTY_PARAMS
+
+            cache_key = None
+            cached_tool = self._registry.get(tool_name)
+            if cached_tool is not None and cached_tool.cacheable:
+                cache_key = _cache_key(tool_name, parameters)
+                hit = self._cache_get(cache_key)
+                if hit is not None:
+                    results[idx] = hit
+                    continue
+
+            tool, error = self._prepare(tool_name, parameters)
+            if error is not None:
+                results[idx] = error
+                continue
+
+            if tool.supports_inline:
+                # Inline tools promise to return promptly; running them
+                # here mirrors execute() and leaves the pool slots to
+                # the calls that actually need them
+                result = self._run(tool, tool_name, parameters)
+                if cache_key is not None and result.success:
+                    self._cache_put(cache_key, result, tool.cache_ttl)
+                results[idx] = result
+                continue
+
+            # Same cancel contract as _execute_with_timeout: cooperating
+            # tools get a token so a timed-out body can actually stop
+            # instead of pinning its worker for the rest of the process
+            cancel_token = None
+            if tool.supports_cancel:
+                cancel_token = threading.Event()
+                parameters = {**parameters, "cancel_token": cancel_token}
+
+            future = self._get_executor().submit(self._run, tool, tool_name, parameters)
+            pending.append((idx, tool_name, future, cache_key, tool, cancel_token))
+
+        for idx, tool_name, future, cache_key, tool, cancel_token in pending:
+            try:
+                result = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                if cancel_token is not None:
+                    cancel_token.set()
+                else:
+                    future.cancel()
+                self._failed.increment()
+                self._logger.error("Tool '%s' exceeded timeout of %ss", tool_name, timeout)
+                results[idx] = ToolResult(
+                    success=False,
+                    error=f"Execution exceeded timeout of {timeout}s",
+                    metadata={"timeout": timeout}
+                )
+                continue
+            if cache_key is not None and result.success:
+                self._cache_put(cache_key, result, tool.cache_ttl)
+            results[idx] = result
 
         return results
 
-    def get_metrics(self) -> Dict[str, Any]:
+    def get_metrics(self) -> ExecutorMetrics:
         """
         Get execution metrics.
 
         Returns:
-            Dictionary of metrics
+            Frozen metrics snapshot (supports dict-style item access)
         """
-        metrics = self._metrics.copy()
-
-        if metrics["total_executions"] > 0:
-            metrics["success_rate"] = (
-                metrics["successful_executions"] / metrics["total_executions"]
-            )
-            metrics["average_time"] = (
-                metrics["total_time"] / metrics["total_executions"]
-            )
-        else:
-            metrics["success_rate"] = 0.0
-            metrics["average_time"] = 0.0
-
-        return metrics
+        total = self._total.value()
+        successful = self._successful.value()
+        failed = self._failed.value()
+        total_time = self._total_time_ns / 1e9
+
+        return ExecutorMetrics(
+            total_executions=total,
+            successful_executions=successful,
+            failed_executions=failed,
+            retries=self._retries.value(),
+            total_time=total_time,
+            success_rate=successful / total if total else 0.0,
+            average_time=total_time / total if total else 0.0,
+        )
 
     def reset_metrics(self):
         """Reset execution metrics."""
-        self._metrics = {
-            "total_executions": 0,
-            "successful_executions": 0,
-            "failed_executions": 0,
-            "total_time": 0.0,
-        }
+        self._total = _AtomicCounter()
+        self._successful = _AtomicCounter()
+        self._failed = _AtomicCounter()
+        self._retries = _AtomicCounter()
+        with self._time_lock:
+            self._total_time_ns = 0
         self._logger.info("Reset executor metrics")
 
     def shutdown(self, wait: bool = True):
@@ -228,7 +630,8 @@ class ToolExecutor:
         Args:
             wait: If True, wait for pending executions to complete
         """
-        self._executor.shutdown(wait=wait)
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
         self._logger.info("Executor shutdown")
 
     def __enter__(self):
@@ -8,7 +8,10 @@ The manager brings together:
 - Built-in tools
 """
 
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -47,6 +50,11 @@ class ToolManager:
         self.executor = ToolExecutor(registry=self.registry, default_timeout=timeout)
         self.mcp_client = MCPClient()
 
+        # get_stats walks every source and server; cache the answer
+        # briefly for pollers (monitoring endpoints, dashboards)
+        self._stats_cache = None
+        self._stats_ttl = 1.0
+
         # Initialize built-in tools if enabled
         if not config or config.is_builtin_tools_enabled():
             self._register_builtin_tools()
@@ -61,29 +69,52 @@ class ToolManager:
         for tool in builtin_tools:
             self.registry.register(tool, source="builtin", tags=["builtin"])
 
+        self._stats_cache = None
         self._logger.info(f"Registered {len(builtin_tools)} built-in tools")
 
     def _initialize_mcp_servers(self):
-        """Initialize configured MCP servers."""
+        """
+        Initialize configured MCP servers.
+
+        Servers connect and discover concurrently - each handshake is a
+        network round-trip, so serial startup cost N server latencies
+        while the slowest server now bounds the whole step.
+        """
         if not self._config:
             return
 
-        servers = self._config.get_mcp_servers()
-        for server_config in servers:
+        servers = []
+        for server_config in self._config.get_mcp_servers():
             try:
                 server = MCPServer.from_dict(server_config)
                 self.mcp_client.add_server(server)
-
-                # Connect if auto-discover is enabled
-                if self._config.should_auto_discover_tools():
-                    if self.mcp_client.connect(server.name):
-                        self._discover_tools_from_server(server.name)
-                    else:
-                        self._logger.warning(f"Failed to connect to MCP server '{server.name}'")
-
+                servers.append(server)
             except Exception as e:
                 self._logger.exception(f"Error initializing MCP server: {e}")
 
+        if not servers or not self._config.should_auto_discover_tools():
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(servers), 16)) as pool:
+            futures = {
+                pool.submit(self._connect_and_discover, server.name): server.name
+                for server in servers
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    self._logger.exception(
+                        f"Error initializing MCP server '{futures[future]}': {e}"
+                    )
+
+    def _connect_and_discover(self, server_name: str):
+        """Connect to one MCP server and register its tools."""
+        if self.mcp_client.connect(server_name):
+            self._discover_tools_from_server(server_name)
+        else:
+            self._logger.warning(f"Failed to connect to MCP server '{server_name}'")
+
     def _discover_tools_from_server(self, server_name: str):
         """
         Discover and register tools from an MCP server.
@@ -99,6 +130,7 @@ class ToolManager:
                 tags=["mcp", server_name]
             )
 
+        self._stats_cache = None
         self._logger.info(f"Registered {len(tools)} tools from MCP server '{server_name}'")
 
     def execute_tool(self, tool_name: str, parameters: dict = None, timeout: int = None):
@@ -115,6 +147,21 @@ class ToolManager:
         """
         return self.executor.execute(tool_name, parameters, timeout)
 
+    async def aexecute_tool(self, tool_name: str, parameters: dict = None,
+                            timeout: int = None):
+        """
+        Execute a tool by name from an event loop.
+
+        Args:
+            tool_name: Name of the tool
+            parameters: Tool parameters
+            timeout: Execution timeout
+
+        Returns:
+            ToolResult
+        """
+        return await self.executor.aexecute(tool_name, parameters, timeout)
+
     def connect_mcp_server(self, server_name: str) -> bool:
         """
         Connect to an MCP server and discover its tools.
@@ -127,6 +174,7 @@ class ToolManager:
         """
         if self.mcp_client.connect(server_name):
             self._discover_tools_from_server(server_name)
+            self._stats_cache = None
             return True
         return False
 
@@ -142,6 +190,7 @@ class ToolManager:
         """
         # Remove tools from this server
         self.registry.clear(source=f"mcp:{server_name}")
+        self._stats_cache = None
 
         # Disconnect
         return self.mcp_client.disconnect(server_name)
@@ -164,8 +213,8 @@ class ToolManager:
             "name": tool.name,
             "description": tool.description,
             "parameters": [p.to_dict() for p in tool.parameters],
-            "source": self.registry.get_source(tool_name),
-            "tags": self.registry.get_tags(tool_name),
+            "source": getattr(tool, "_source", None),
+            "tags": getattr(tool, "_registered_tags", []),
         }
 
     def get_stats(self) -> dict:
@@ -175,14 +224,14 @@ class ToolManager:
         Returns:
             Dictionary of statistics
         """
-        return {
+        cached = self._stats_cache
+        if cached is not None and time.monotonic() - cached[0] < self._stats_ttl:
+            return cached[1]
+
+        stats = {
             "total_tools": self.registry.count(),
             "builtin_tools": self.registry.count(source="builtin"),
-            "mcp_tools": sum(
-                self.registry.count(source=s)
-                for s in self.registry.list_sources()
-                if s.startswith("mcp:")
-            ),
+            "mcp_tools": self.registry.count_by_source_prefix("mcp:"),
             "mcp_servers": len(self.mcp_client.list_servers()),
             "connected_servers": sum(
                 1 for s in self.mcp_client.list_servers()
@@ -190,6 +239,8 @@ class ToolManager:
             ),
             "execution_metrics": self.executor.get_metrics(),
         }
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
 
     def shutdown(self):
         """Shutdown the tool manager and cleanup resources."""
@@ -8,15 +8,51 @@ This module provides:
 - Session management
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
+import itertools
 import json
 import logging
+import os
 import subprocess
+from collections import OrderedDict
+import threading
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 from .base import Tool, ToolParameter, ToolResult, ToolParameterType
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX platforms
+    fcntl = None
+
+# Linux-only; the constant predates its fcntl module alias (added 3.10)
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031) if fcntl else None
+
+# orjson decodes/encodes JSON several times faster than the stdlib and is
+# used when installed; the wire format is unchanged. Both paths hand the
+# reader bytes in and take bytes out, and orjson's decode errors subclass
+# ValueError so the error handling is shared.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+    def _canonical_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+    def _canonical_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode()
+
 
 class MCPTransport(Enum):
     """Supported MCP transport mechanisms."""
@@ -25,6 +61,11 @@ class MCPTransport(Enum):
     SSE = "sse"      # Server-Sent Events
 
 
+# value -> member, so from_dict skips the Enum __call__ machinery (a
+# DynamicClassAttribute lookup plus missing-value handling per call)
+_TRANSPORT_CACHE = {member.value: member for member in MCPTransport}
+
+
 @dataclass
 class MCPServer:
     """
@@ -49,6 +90,13 @@ class MCPServer:
     enabled: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Memoized {**os.environ, **env} merge; the process environment can
+    # run to hundreds of entries, so build it on first connect and reuse
+    # it across reconnects
+    _merged_env: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
         return {
@@ -67,7 +115,10 @@ class MCPServer:
         """Create from dictionary format."""
         transport = data.get("transport", "stdio")
         if isinstance(transport, str):
-            transport = MCPTransport(transport)
+            cached = _TRANSPORT_CACHE.get(transport)
+            # Fall through to the Enum constructor for unknown values so
+            # the error message is unchanged
+            transport = cached if cached is not None else MCPTransport(transport)
 
         return cls(
             name=data["name"],
@@ -81,6 +132,166 @@ class MCPServer:
         )
 
 
+# JSON Schema type -> ToolParameterType, built once at import time
+_JSON_TYPE_MAP = {
+    "string": ToolParameterType.STRING,
+    "integer": ToolParameterType.INTEGER,
+    "number": ToolParameterType.FLOAT,
+    "boolean": ToolParameterType.BOOLEAN,
+    "object": ToolParameterType.OBJECT,
+    "array": ToolParameterType.ARRAY,
+}
+
+
+# Re-discovery across reconnects and agents yields byte-identical tool
+# definitions; intern them by content hash so all MCPTool instances for
+# the same logical tool share one dict instead of each keeping a copy.
+# Interned definitions are treated as immutable.
+_TOOLDEF_CACHE_SIZE = 1024
+_tooldef_intern: 'OrderedDict[bytes, Dict[str, Any]]' = OrderedDict()
+_tooldef_lock = threading.Lock()
+
+
+def _intern_tool_def(tool_def: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the shared canonical instance of a tool definition.
+
+    Args:
+        tool_def: Tool definition from an MCP server
+
+    Returns:
+        The cached dict for identical content, or the input itself if it
+        cannot be canonically serialized
+    """
+    try:
+        key = hashlib.blake2b(
+            _canonical_dumps(tool_def), digest_size=16
+        ).digest()
+    except (TypeError, ValueError):
+        return tool_def
+
+    with _tooldef_lock:
+        cached = _tooldef_intern.get(key)
+        if cached is not None:
+            _tooldef_intern.move_to_end(key)
+            return cached
+
+        _tooldef_intern[key] = tool_def
+        if len(_tooldef_intern) > _TOOLDEF_CACHE_SIZE:
+            _tooldef_intern.popitem(last=False)
+
+    return tool_def
+
+
+# Servers reship identical inputSchema blobs on every reconnect and to
+# every agent re-discovering tools; cache parse results by content hash
+# so the schema walk runs once per distinct schema. Entries are shared
+# tuples and treated as immutable.
+_SCHEMA_CACHE_SIZE = 1024
+_schema_param_cache: 'OrderedDict[bytes, tuple]' = OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+
+def _cached_schema_parameters(schema: Dict[str, Any]) -> tuple:
+    """
+    Parse a schema through the content-hash cache.
+
+    Schemas that cannot be canonically serialized fall back to a direct
+    parse; everything else is keyed by a 16-byte blake2b digest of the
+    sorted-keys JSON dump with LRU eviction.
+
+    Args:
+        schema: JSON Schema object
+
+    Returns:
+        Tuple of ToolParameter objects (shared across identical schemas)
+    """
+    try:
+        key = hashlib.blake2b(
+            _canonical_dumps(schema), digest_size=16
+        ).digest()
+    except (TypeError, ValueError):
+        return _parse_schema_parameters(schema)
+
+    with _schema_cache_lock:
+        cached = _schema_param_cache.get(key)
+        if cached is not None:
+            _schema_param_cache.move_to_end(key)
+            return cached
+
+    parameters = _parse_schema_parameters(schema)
+
+    with _schema_cache_lock:
+        _schema_param_cache[key] = parameters
+        if len(_schema_param_cache) > _SCHEMA_CACHE_SIZE:
+            _schema_param_cache.popitem(last=False)
+
+    return parameters
+
+
+def _parse_schema_parameters(schema: Dict[str, Any]) -> tuple:
+    """
+    Parse an MCP input schema into a tuple of ToolParameter objects.
+
+    This is the specialized form of the old per-instance walk: every
+    lookup the loop needs (the type map, the STRING fallback, the
+    required set) is bound to a local once, and nested object/array
+    schemas are built with the same straight-line code - no bound-method
+    dispatch per property.
+
+    Args:
+        schema: JSON Schema object
+
+    Returns:
+        Tuple of ToolParameter objects
+    """
+    properties = schema.get("properties")
+    if not properties:
+        return ()
+
+    required = set(schema.get("required", ()))
+    type_map_get = _JSON_TYPE_MAP.get
+    string_type = ToolParameterType.STRING
+
+    parameters = []
+    for param_name, param_schema in properties.items():
+        schema_get = param_schema.get
+        param_type = type_map_get(schema_get("type", "string"), string_type)
+
+        param = ToolParameter(
+            name=param_name,
+            type=param_type,
+            description=schema_get("description", ""),
+            required=param_name in required,
+            default=schema_get("default"),
+            enum=schema_get("enum"),
+        )
+
+        # Handle nested objects
+        if param_type == ToolParameterType.OBJECT and "properties" in param_schema:
+            param.properties = {
+                k: ToolParameter(
+                    name=k,
+                    type=type_map_get(v.get("type", "string"), string_type),
+                    description=v.get("description", ""),
+                )
+                for k, v in param_schema["properties"].items()
+            }
+
+        # Handle arrays
+        elif param_type == ToolParameterType.ARRAY and "items" in param_schema:
+            items_schema = param_schema["items"]
+            param.items = ToolParameter(
+                name="item",
+                type=type_map_get(items_schema.get("type", "string"), string_type),
+                description=items_schema.get("description", ""),
+            )
+
+        parameters.append(param)
+
+    return tuple(parameters)
+
+
 class MCPTool(Tool):
     """
     A tool provided by an MCP server.
@@ -99,12 +310,16 @@ class MCPTool(Tool):
             client: MCP client for execution
         """
         self._server_name = server_name
-        self._tool_def = tool_def
+        self._tool_def = _intern_tool_def(tool_def)
         self._client = client
         self._name = tool_def.get("name", "")
         self._description = tool_def.get("description", "")
-        self._parameters = self._parse_parameters(tool_def.get("inputSchema", {}))
+        self._parameters = _cached_schema_parameters(tool_def.get("inputSchema", {}))
 
+        # Fields must be assigned before this call: Tool.__init__ reads
+        # the name/description/parameters properties exactly once (to
+        # validate and build the parameter index) and re-parses nothing,
+        # so the schema walk above is the only one per tool
         super().__init__()
 
     @property
@@ -126,6 +341,9 @@ class MCPTool(Tool):
         """
         Execute the tool via MCP.
 
+        The call rides the warm session established at connect time; it
+        never triggers a reconnect or a fresh ``initialize`` handshake.
+
         Args:
             **kwargs: Tool parameters
 
@@ -138,63 +356,21 @@ class MCPTool(Tool):
         """
         Parse MCP input schema into ToolParameter objects.
 
+        Retained for subclasses; the real work lives in the module-level
+        _parse_schema_parameters.
+
         Args:
             schema: JSON Schema object
 
         Returns:
             List of ToolParameter objects
         """
-        parameters = []
-        properties = schema.get("properties", {})
-        required = set(schema.get("required", []))
-
-        for param_name, param_schema in properties.items():
-            param_type = self._map_json_type(param_schema.get("type", "string"))
-
-            param = ToolParameter(
-                name=param_name,
-                type=param_type,
-                description=param_schema.get("description", ""),
-                required=param_name in required,
-                default=param_schema.get("default"),
-                enum=param_schema.get("enum"),
-            )
-
-            # Handle nested objects
-            if param_type == ToolParameterType.OBJECT and "properties" in param_schema:
-                param.properties = {
-                    k: ToolParameter(
-                        name=k,
-                        type=self._map_json_type(v.get("type", "string")),
-                        description=v.get("description", ""),
-                    )
-                    for k, v in param_schema["properties"].items()
-                }
+        return list(_parse_schema_parameters(schema))
 
-            # Handle arrays
-            if param_type == ToolParameterType.ARRAY and "items" in param_schema:
-                items_schema = param_schema["items"]
-                param.items = ToolParameter(
-                    name="item",
-                    type=self._map_json_type(items_schema.get("type", "string")),
-                    description=items_schema.get("description", ""),
-                )
-
-            parameters.append(param)
-
-        return parameters
-
-    def _map_json_type(self, json_type: str) -> ToolParameterType:
+    @staticmethod
+    def _map_json_type(json_type: str) -> ToolParameterType:
         """Map JSON Schema type to ToolParameterType."""
-        mapping = {
-            "string": ToolParameterType.STRING,
-            "integer": ToolParameterType.INTEGER,
-            "number": ToolParameterType.FLOAT,
-            "boolean": ToolParameterType.BOOLEAN,
-            "object": ToolParameterType.OBJECT,
-            "array": ToolParameterType.ARRAY,
-        }
-        return mapping.get(json_type, ToolParameterType.STRING)
+        return _JSON_TYPE_MAP.get(json_type, ToolParameterType.STRING)
 
 
 class MCPClient:
@@ -208,10 +384,25 @@ class MCPClient:
     - Resource management
     """
 
-    def __init__(self):
-        """Initialize the MCP client."""
+    # A hung server must not wedge the calling agent forever
+    DEFAULT_REQUEST_TIMEOUT = 30.0
+
+    def __init__(self, request_timeout: float = DEFAULT_REQUEST_TIMEOUT):
+        """
+        Initialize the MCP client.
+
+        Args:
+            request_timeout: Seconds to wait for any single JSON-RPC
+                reply; servers can override it via a "request_timeout"
+                entry in their metadata
+        """
+        self._request_timeout = request_timeout
         self._servers: Dict[str, MCPServer] = {}
         self._processes: Dict[str, subprocess.Popen] = {}
+        # Per-server session state: whether the MCP handshake completed,
+        # the serverInfo it returned, and the JSON-RPC id counter. One
+        # warm subprocess serves all calls for the client's lifetime.
+        self._sessions: Dict[str, Dict[str, Any]] = {}
         self._logger = logging.getLogger(__name__)
 
     def add_server(self, server: MCPServer) -> bool:
@@ -225,10 +416,10 @@ class MCPClient:
             True if added successfully
         """
         if server.name in self._servers:
-            self._logger.warning(f"Server '{server.name}' already exists, replacing")
+            self._logger.warning("Server '%s' already exists, replacing", server.name)
 
         self._servers[server.name] = server
-        self._logger.info(f"Added MCP server '{server.name}'")
+        self._logger.info("Added MCP server '%s'", server.name)
         return True
 
     def remove_server(self, server_name: str) -> bool:
@@ -248,7 +439,7 @@ class MCPClient:
         self.disconnect(server_name)
 
         del self._servers[server_name]
-        self._logger.info(f"Removed MCP server '{server_name}'")
+        self._logger.info("Removed MCP server '%s'", server_name)
         return True
 
     def connect(self, server_name: str) -> bool:
@@ -262,22 +453,56 @@ class MCPClient:
             True if connection succeeded
         """
         if server_name not in self._servers:
-            self._logger.error(f"Server '{server_name}' not found")
+            self._logger.error("Server '%s' not found", server_name)
             return False
 
+        # Reuse the warm session: the initialize exchange happened once
+        # at first connect and is never repeated for the same process.
+        # A session is only warm while the process is alive - a dead
+        # server would otherwise answer every call with a broken pipe
+        process = self._processes.get(server_name)
+        if process is not None:
+            if process.poll() is None:
+                return True
+            self._logger.warning(
+                "MCP server '%s' exited with code %s; reconnecting",
+                server_name, process.returncode,
+            )
+            self.disconnect(server_name)
+
         server = self._servers[server_name]
 
         if not server.enabled:
-            self._logger.warning(f"Server '{server_name}' is disabled")
+            self._logger.warning("Server '%s' is disabled", server_name)
             return False
 
         # Only stdio is implemented in this basic version
         if server.transport == MCPTransport.STDIO:
             return self._connect_stdio(server_name, server)
         else:
-            self._logger.error(f"Transport '{server.transport}' not yet implemented")
+            self._logger.error("Transport '%s' not yet implemented", server.transport)
             return False
 
+    def get_or_connect(self, server_name: str) -> bool:
+        """
+        Ensure a warm session exists for a server, connecting on demand.
+
+        Callers that previously wrapped each tool call in
+        connect()/disconnect() paid the full subprocess spawn plus MCP
+        handshake per call; this keys one session per server name for
+        the client's lifetime.
+
+        Args:
+            server_name: Name of the server
+
+        Returns:
+            True if a live session exists
+        """
+        process = self._processes.get(server_name)
+        if process is not None and process.poll() is None:
+            return True
+        return self.connect(server_name)
+
     def _connect_stdio(self, server_name: str, server: MCPServer) -> bool:
         """
         Connect to an MCP server via stdio.
@@ -290,27 +515,89 @@ class MCPClient:
             True if connection succeeded
         """
         if not server.command:
-            self._logger.error(f"No command specified for server '{server_name}'")
+            self._logger.error("No command specified for server '%s'", server_name)
             return False
 
         try:
             # Start the server process
+            env = server._merged_env
+            if env is None:
+                env = server._merged_env = {**os.environ, **server.env}
+
+            # An unread stderr PIPE wedges verbose servers once the
+            # kernel buffer fills; discard it unless debug logging is on,
+            # in which case a drain thread relays it line by line
+            capture_stderr = self._logger.isEnabledFor(logging.DEBUG)
+
+            # Binary pipes: frames are parsed and decoded whole rather
+            # than through text-mode readline's per-character layer.
+            # bufsize=0 skips the BufferedWriter layer on stdin - every
+            # write is already one complete frame - and the reader pulls
+            # straight from the fd
             process = subprocess.Popen(
                 [server.command] + server.args,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env={**subprocess.os.environ, **server.env},
-                text=True,
+                stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+                env=env,
+                bufsize=0,
             )
 
-            self._processes[server_name] = process
-            self._logger.info(f"Connected to MCP server '{server_name}' via stdio")
+            if capture_stderr:
+                threading.Thread(
+                    target=self._drain_stderr,
+                    args=(server_name, process),
+                    name=f"mcp-err-{server_name}",
+                    daemon=True,
+                ).start()
+
+            # Grow the kernel pipes to 1 MiB so large tool responses
+            # move in fewer syscalls; best effort - the fcntl is
+            # Linux-only and subject to /proc/sys/fs/pipe-max-size
+            if _F_SETPIPE_SZ is not None:
+                for pipe in (process.stdout, process.stdin):
+                    try:
+                        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, 1 << 20)
+                    except OSError:
+                        pass
 
-            # Send initialize request
-            self._send_request(server_name, {
+            self._processes[server_name] = process
+            session = {
+                "initialized": False,
+                "server_info": {},
+                "timeout": server.metadata.get(
+                    "request_timeout", self._request_timeout
+                ),
+                "next_id": itertools.count(1),
+                # In-flight requests awaiting their response, keyed by
+                # JSON-RPC id; the reader thread resolves them
+                "pending": {},
+                "write_lock": threading.Lock(),
+            }
+            self._sessions[server_name] = session
+
+            # One background reader per server demultiplexes responses by
+            # id, so any number of requests can be outstanding at once
+            # without readline() stealing another call's reply
+            reader = threading.Thread(
+                target=self._read_loop,
+                args=(server_name, process, session),
+                name=f"mcp-read-{server_name}",
+                daemon=True,
+            )
+            session["reader"] = reader
+            reader.start()
+
+            self._logger.info("Connected to MCP server '%s' via stdio", server_name)
+
+            # Pipeline the whole handshake: initialize, the initialized
+            # notification, and tools/list go out back-to-back and the
+            # demux sorts the replies, so a usable tool list is one
+            # round trip away instead of two. (JSON-RPC array batching
+            # would fold the frames too, but MCP servers commonly reject
+            # it; pipelining gets the same overlap on stdio.)
+            init_future = self._send_request_nowait(server_name, {
                 "jsonrpc": "2.0",
-                "id": 1,
                 "method": "initialize",
                 "params": {
                     "protocolVersion": "2024-11-05",
@@ -321,11 +608,36 @@ class MCPClient:
                     }
                 }
             })
+            self._send_notification(server_name, {
+                "jsonrpc": "2.0",
+                "method": "notifications/initialized",
+            })
+            tools_future = self._send_request_nowait(server_name, {
+                "jsonrpc": "2.0",
+                "method": "tools/list",
+                "params": {}
+            })
+            if tools_future is not None:
+                # The first discover_tools() consumes this instead of
+                # paying another round trip
+                session["tools_future"] = tools_future
+
+            response = None
+            if init_future is not None:
+                try:
+                    response = init_future.result(session["timeout"])
+                except concurrent.futures.TimeoutError:
+                    self._logger.warning(
+                        "initialize on server '%s' timed out", server_name
+                    )
+            if response and "result" in response:
+                session["initialized"] = True
+                session["server_info"] = response["result"].get("serverInfo", {})
 
             return True
 
-        except Exception as e:
-            self._logger.exception(f"Failed to connect to server '{server_name}': {e}")
+        except Exception:
+            self._logger.exception("Failed to connect to server '%s'", server_name)
             return False
 
     def disconnect(self, server_name: str) -> bool:
@@ -351,7 +663,12 @@ class MCPClient:
             process.kill()
 
         del self._processes[server_name]
-        self._logger.info(f"Disconnected from MCP server '{server_name}'")
+        session = self._sessions.pop(server_name, None)
+        if session is not None and "reader" in session:
+            # Terminating the process closes stdout, which unwinds the
+            # reader and fails any still-pending requests
+            session["reader"].join(timeout=5)
+        self._logger.info("Disconnected from MCP server '%s'", server_name)
         return True
 
     def discover_tools(self, server_name: str) -> List[MCPTool]:
@@ -365,17 +682,25 @@ class MCPClient:
             List of MCPTool objects
         """
         if server_name not in self._processes:
-            self._logger.error(f"Not connected to server '{server_name}'")
+            self._logger.error("Not connected to server '%s'", server_name)
             return []
 
         try:
-            # Send tools/list request
-            response = self._send_request(server_name, {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list",
-                "params": {}
-            })
+            # Use the reply pipelined at connect time if it has not been
+            # consumed yet; otherwise pay the round trip now
+            session = self._sessions[server_name]
+            prefetched = session.pop("tools_future", None)
+            if prefetched is not None:
+                try:
+                    response = prefetched.result(session["timeout"])
+                except concurrent.futures.TimeoutError:
+                    response = None
+            else:
+                response = self._send_request(server_name, {
+                    "jsonrpc": "2.0",
+                    "method": "tools/list",
+                    "params": {}
+                })
 
             if not response or "result" not in response:
                 return []
@@ -387,12 +712,12 @@ class MCPClient:
             ]
 
             self._logger.info(
-                f"Discovered {len(tools)} tools from server '{server_name}'"
+                "Discovered %d tools from server '%s'", len(tools), server_name
             )
             return tools
 
-        except Exception as e:
-            self._logger.exception(f"Failed to discover tools from '{server_name}': {e}")
+        except Exception:
+            self._logger.exception("Failed to discover tools from '%s'", server_name)
             return []
 
     def call_tool(self, server_name: str, tool_name: str,
@@ -418,7 +743,6 @@ class MCPClient:
             # Send tools/call request
             response = self._send_request(server_name, {
                 "jsonrpc": "2.0",
-                "id": 3,
                 "method": "tools/call",
                 "params": {
                     "name": tool_name,
@@ -450,46 +774,198 @@ class MCPClient:
             )
 
         except Exception as e:
-            self._logger.exception(f"Failed to call tool '{tool_name}': {e}")
+            self._logger.exception("Failed to call tool '%s'", tool_name)
             return ToolResult(
                 success=False,
                 error=f"Exception: {str(e)}"
             )
 
+    def _drain_stderr(self, server_name: str, process: subprocess.Popen):
+        """
+        Keep a server's stderr drained, relaying each line at DEBUG.
+
+        Args:
+            server_name: Name of the server
+            process: The server subprocess
+        """
+        for line in process.stderr:
+            self._logger.debug(
+                "MCP server '%s' stderr: %s",
+                server_name, line.decode(errors="replace").rstrip()
+            )
+
+    def _read_loop(self, server_name: str, process: subprocess.Popen,
+                   session: Dict[str, Any]):
+        """
+        Reader-thread body: dispatch responses to pending requests by id.
+
+        Runs until the server closes its stdout. Messages without an id
+        (server notifications) are ignored; on EOF every still-pending
+        request is resolved to None so no caller blocks forever.
+
+        Frames are accumulated with large os.read calls into a bytes
+        buffer and split on newlines, so a big tool response costs a few
+        syscalls and one JSON decode instead of a Python-level readline
+        loop over a text stream.
+
+        Args:
+            server_name: Name of the server
+            process: The server subprocess
+            session: The session record holding the pending map
+        """
+        pending = session["pending"]
+        fd = process.stdout.fileno()
+        buf = bytearray()
+        try:
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                buf += chunk
+
+                while True:
+                    end = buf.find(b"\n")
+                    if end == -1:
+                        break
+                    frame = bytes(buf[:end])
+                    del buf[:end + 1]
+                    if not frame.strip():
+                        continue
+                    try:
+                        response = _loads(frame)
+                    except ValueError:
+                        self._logger.warning(
+                            "Malformed JSON-RPC frame from server '%s'",
+                            server_name
+                        )
+                        continue
+
+                    future = pending.pop(response.get("id"), None)
+                    if future is not None:
+                        future.set_result(response)
+        except Exception:
+            self._logger.exception("Reader for server '%s' died", server_name)
+        finally:
+            for future in list(pending.values()):
+                if not future.done():
+                    future.set_result(None)
+            pending.clear()
+
     def _send_request(self, server_name: str, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Send a JSON-RPC request to an MCP server.
+        Send a JSON-RPC request to an MCP server and wait for its reply.
+
+        The request is numbered from the per-session counter, parked in
+        the pending map, and written under the session's write lock; the
+        reader thread resolves the future when the matching id arrives.
+        Overlapping calls from different threads therefore pipeline on
+        the wire instead of corrupting each other's replies.
 
         Args:
             server_name: Name of the server
-            request: JSON-RPC request
+            request: JSON-RPC request (id is assigned here)
 
         Returns:
             Response dictionary, or None if failed
         """
-        if server_name not in self._processes:
+        future = self._send_request_nowait(server_name, request)
+        if future is None:
+            return None
+
+        session = self._sessions[server_name]
+        try:
+            return future.result(session["timeout"])
+        except concurrent.futures.TimeoutError:
+            session["pending"].pop(request["id"], None)
+            self._logger.warning(
+                "Request to server '%s' timed out after %.0fs "
+                "(method %s)",
+                server_name, session["timeout"], request.get("method")
+            )
+            return None
+
+    def _send_request_nowait(self, server_name: str,
+                             request: Dict[str, Any]) -> Optional[concurrent.futures.Future]:
+        """
+        Write a JSON-RPC request without waiting for its reply.
+
+        Requests written back-to-back pipeline on the wire; the reader
+        thread resolves each returned future as its response arrives.
+
+        Args:
+            server_name: Name of the server
+            request: JSON-RPC request (id is assigned here)
+
+        Returns:
+            Future resolving to the response dict (or None on EOF), or
+            None if the write itself failed
+        """
+        session = self._sessions.get(server_name)
+        if session is None:
             return None
 
         process = self._processes[server_name]
+        request_id = next(session["next_id"])
+        request["id"] = request_id
 
-        try:
-            # Send request
-            request_json = json.dumps(request) + "\n"
-            process.stdin.write(request_json)
-            process.stdin.flush()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        session["pending"][request_id] = future
 
-            # Read response
-            response_line = process.stdout.readline()
-            if not response_line:
-                return None
+        try:
+            frame = _dumps(request) + b"\n"
+            with session["write_lock"]:
+                process.stdin.write(frame)
+                process.stdin.flush()
 
-            response = json.loads(response_line)
-            return response
+            return future
 
-        except Exception as e:
-            self._logger.exception(f"Error communicating with server '{server_name}': {e}")
+        except Exception:
+            session["pending"].pop(request_id, None)
+            self._logger.exception("Error communicating with server '%s'", server_name)
             return None
 
+    def _send_notification(self, server_name: str, notification: Dict[str, Any]):
+        """
+        Write a JSON-RPC notification (no id, no reply expected).
+
+        Args:
+            server_name: Name of the server
+            notification: JSON-RPC notification
+        """
+        session = self._sessions.get(server_name)
+        if session is None:
+            return
+
+        process = self._processes[server_name]
+        try:
+            frame = _dumps(notification) + b"\n"
+            with session["write_lock"]:
+                process.stdin.write(frame)
+                process.stdin.flush()
+        except Exception:
+            self._logger.exception("Error communicating with server '%s'", server_name)
+
+    async def acall_tool(self, server_name: str, tool_name: str,
+                         arguments: Dict[str, Any]) -> ToolResult:
+        """
+        Call a tool on an MCP server from an event loop.
+
+        The blocking pipe round trip runs on a worker thread, so several
+        in-flight calls to different servers overlap their I/O waits
+        instead of serializing behind one another.
+
+        Args:
+            server_name: Name of the server
+            tool_name: Name of the tool
+            arguments: Tool arguments
+
+        Returns:
+            ToolResult: Result of the tool execution
+        """
+        return await asyncio.to_thread(
+            self.call_tool, server_name, tool_name, arguments
+        )
+
     def list_servers(self) -> List[MCPServer]:
         """
         List all configured servers.
@@ -529,3 +1005,87 @@ class MCPClient:
     def __repr__(self) -> str:
         """String representation."""
         return f"MCPClient(servers={len(self._servers)}, connected={len(self._processes)})"
+
+
+class AsyncLoopThread:
+    """
+    A daemon thread hosting a private asyncio event loop.
+
+    Multi-agent setups funnel their MCP calls through one shared loop
+    via run_coroutine_threadsafe, so N agents issuing tool calls on N
+    servers overlap their waits rather than blocking each other.
+    """
+
+    def __init__(self):
+        """Start the loop thread."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mcp-loop", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future resolving to the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def shutdown(self):
+        """Stop the loop and join the thread."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"AsyncLoopThread(running={self._thread.is_alive()})"
+
+
+class MCPClientWrapper:
+    """
+    Synchronous facade over one shared MCPClient and loop thread.
+
+    Agent code keeps its plain blocking call_tool() signature, but all
+    calls route through the shared AsyncLoopThread so concurrent callers
+    get true I/O overlap across servers.
+    """
+
+    def __init__(self, client: MCPClient, loop_thread: Optional[AsyncLoopThread] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            client: MCP client to wrap
+            loop_thread: Loop thread to share (created if omitted)
+        """
+        self._client = client
+        self._loop_thread = loop_thread or AsyncLoopThread()
+
+    def call_tool(self, server_name: str, tool_name: str,
+                  arguments: Dict[str, Any],
+                  timeout: Optional[float] = None) -> ToolResult:
+        """
+        Call a tool via the shared loop, blocking until it completes.
+
+        Args:
+            server_name: Name of the server
+            tool_name: Name of the tool
+            arguments: Tool arguments
+            timeout: Seconds to wait for the result (None = forever)
+
+        Returns:
+            ToolResult: Result of the tool execution
+        """
+        future = self._loop_thread.submit(
+            self._client.acall_tool(server_name, tool_name, arguments)
+        )
+        return future.result(timeout)
+
+    def shutdown(self):
+        """Shutdown the loop thread (the client is left to its owner)."""
+        self._loop_thread.shutdown()
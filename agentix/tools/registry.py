@@ -8,8 +8,10 @@ The registry maintains a catalog of all available tools, whether they're:
 """
 
 from typing import Dict, List, Optional, Set, Callable
+import functools
 import logging
-from .base import Tool
+import threading
+from .base import Tool, _compile_validator
 
 
 class ToolRegistry:
@@ -35,8 +37,21 @@ class ToolRegistry:
         self._tools: Dict[str, Tool] = {}
         self._tags: Dict[str, Set[str]] = {}  # tag -> set of tool names
         self._sources: Dict[str, str] = {}  # tool_name -> source
+        self._source_to_names: Dict[str, Set[str]] = {}  # source -> tool names
+        self._name_to_tags: Dict[str, Set[str]] = {}  # tool_name -> tags
+        self._def_cache: Dict[str, Dict] = {}  # tool_name -> definition dict
         self._allow_list = set(allow_list) if allow_list else None
         self._deny_list = set(deny_list) if deny_list else set()
+
+        # Guards mutation, plus the filtered reads that iterate the
+        # index sets. Parallel MCP discovery registers tools from
+        # several pool threads at once, and the indexes must move
+        # together. Single-probe reads (get/has_tool) stay lock-free -
+        # one dict lookup is atomic under the GIL - so the hot paths
+        # never contend with writers. (Per-thread shards were
+        # considered and rejected - tools registered on one thread must
+        # be visible to every agent.)
+        self._lock = threading.RLock()
         self._logger = logging.getLogger(__name__)
 
     def register(self, tool: Tool, source: str = "builtin",
@@ -56,22 +71,48 @@ class ToolRegistry:
             self._logger.warning(f"Tool '{tool.name}' is not allowed (blocked by allow/deny list)")
             return False
 
+        with self._lock:
+            self._register_locked(tool, source, tags)
+
+        self._logger.info(f"Registered tool '{tool.name}' from source '{source}'")
+        return True
+
+    def _register_locked(self, tool: Tool, source: str, tags: Optional[List[str]]):
+        """Apply a registration to every index; caller holds the lock."""
         if tool.name in self._tools:
             self._logger.warning(f"Tool '{tool.name}' is already registered, replacing")
+            self._drop_from_source_index(tool.name)
+            self._drop_from_tag_index(tool.name)
 
         self._tools[tool.name] = tool
         self._sources[tool.name] = source
-
-        # Register tags
+        # Definitions are immutable after registration; build the export
+        # dict once here so to_dict never walks parameters again
+        self._def_cache[tool.name] = tool.to_dict()
+        if source not in self._source_to_names:
+            self._source_to_names[source] = set()
+        self._source_to_names[source].add(tool.name)
+
+        # Specialize the parameter validator once; the executor uses it
+        # on every call instead of the generic validate_parameters walk
+        tool._compiled_validator = _compile_validator(tool.parameters)
+        tool._no_params = not tool.parameters
+
+        # Source and tags are fixed at registration, so stash them on the
+        # tool; hot paths read the attribute instead of querying the
+        # registry maps per call
+        tool._source = source
+        tool._registered_tags = list(tags) if tags else []
+
+        # Register tags in both directions: tag -> names for filtering,
+        # name -> tags for get_tags/to_dict
         if tags:
+            self._name_to_tags[tool.name] = set(tags)
             for tag in tags:
                 if tag not in self._tags:
                     self._tags[tag] = set()
                 self._tags[tag].add(tool.name)
 
-        self._logger.info(f"Registered tool '{tool.name}' from source '{source}'")
-        return True
-
     def unregister(self, tool_name: str) -> bool:
         """
         Unregister a tool from the registry.
@@ -82,23 +123,42 @@ class ToolRegistry:
         Returns:
             True if unregistration succeeded, False if tool wasn't found
         """
-        if tool_name not in self._tools:
-            return False
+        with self._lock:
+            if tool_name not in self._tools:
+                return False
 
-        # Remove from tools
-        del self._tools[tool_name]
+            # Remove from tools
+            del self._tools[tool_name]
+            self._def_cache.pop(tool_name, None)
 
-        # Remove from sources
-        if tool_name in self._sources:
-            del self._sources[tool_name]
+            # Remove from sources
+            if tool_name in self._sources:
+                self._drop_from_source_index(tool_name)
+                del self._sources[tool_name]
 
-        # Remove from tags
-        for tag_set in self._tags.values():
-            tag_set.discard(tool_name)
+            # Remove from tags; the reverse index tells us exactly which
+            # tag sets mention this tool
+            self._drop_from_tag_index(tool_name)
 
         self._logger.info(f"Unregistered tool '{tool_name}'")
         return True
 
+    def _drop_from_source_index(self, tool_name: str):
+        """Remove a tool from the reverse source index, pruning empties."""
+        source = self._sources.get(tool_name)
+        names = self._source_to_names.get(source)
+        if names is not None:
+            names.discard(tool_name)
+            if not names:
+                del self._source_to_names[source]
+
+    def _drop_from_tag_index(self, tool_name: str):
+        """Remove a tool from both tag indexes."""
+        for tag in self._name_to_tags.pop(tool_name, ()):
+            names = self._tags.get(tag)
+            if names is not None:
+                names.discard(tool_name)
+
     def get(self, tool_name: str) -> Optional[Tool]:
         """
         Get a tool by name.
@@ -123,16 +183,29 @@ class ToolRegistry:
         Returns:
             List of tool instances
         """
-        tools = list(self._tools.values())
+        if tag is None and source is None:
+            return list(self._tools.values())
 
-        if tag:
-            tool_names = self._tags.get(tag, set())
-            tools = [t for t in tools if t.name in tool_names]
+        tools = self._tools
+        found = (tools.get(name) for name in self._filter_names(tag, source))
+        return [tool for tool in found if tool is not None]
 
-        if source:
-            tools = [t for t in tools if self._sources.get(t.name) == source]
+    def _filter_names(self, tag: Optional[str], source: Optional[str]) -> Set[str]:
+        """
+        Resolve a tag/source filter to a set of matching tool names.
 
-        return tools
+        Both filters are backed by name-set indexes, so the combined
+        case is one C-level set intersection rather than sequential
+        scans over every registered tool. The result is a snapshot
+        taken under the lock - callers iterate it while parallel MCP
+        discovery may be mutating the live sets underneath.
+        """
+        with self._lock:
+            if tag is not None and source is not None:
+                return self._tags.get(tag, set()) & self._source_to_names.get(source, set())
+            if tag is not None:
+                return set(self._tags.get(tag, ()))
+            return set(self._source_to_names.get(source, ()))
 
     def list_names(self, tag: Optional[str] = None,
                    source: Optional[str] = None) -> List[str]:
@@ -146,7 +219,12 @@ class ToolRegistry:
         Returns:
             List of tool names
         """
-        return [t.name for t in self.list_tools(tag=tag, source=source)]
+        if tag is None and source is None:
+            return list(self._tools)
+
+        # The indexes already hold the names; no need to touch Tool
+        # instances at all
+        return list(self._filter_names(tag, source))
 
     def has_tool(self, tool_name: str) -> bool:
         """
@@ -182,7 +260,7 @@ class ToolRegistry:
         Returns:
             List of tags
         """
-        return [tag for tag, names in self._tags.items() if tool_name in names]
+        return list(self._name_to_tags.get(tool_name, ()))
 
     def list_sources(self) -> List[str]:
         """
@@ -191,7 +269,7 @@ class ToolRegistry:
         Returns:
             List of source names
         """
-        return list(set(self._sources.values()))
+        return list(self._source_to_names)
 
     def list_tags(self) -> List[str]:
         """
@@ -211,19 +289,22 @@ class ToolRegistry:
                    If None, clear all tools.
         """
         if source is None:
-            self._tools.clear()
-            self._sources.clear()
-            self._tags.clear()
+            with self._lock:
+                self._tools.clear()
+                self._sources.clear()
+                self._tags.clear()
+                self._source_to_names.clear()
+                self._name_to_tags.clear()
+                self._def_cache.clear()
             self._logger.info("Cleared all tools from registry")
         else:
-            # Find tools from this source
-            tools_to_remove = [
-                name for name, src in self._sources.items()
-                if src == source
-            ]
+            # The reverse index hands us exactly the matching subset;
+            # the lock is reentrant, so unregister nests cleanly
+            with self._lock:
+                tools_to_remove = list(self._source_to_names.get(source, ()))
 
-            for name in tools_to_remove:
-                self.unregister(name)
+                for name in tools_to_remove:
+                    self.unregister(name)
 
             self._logger.info(f"Cleared {len(tools_to_remove)} tools from source '{source}'")
 
@@ -240,7 +321,23 @@ class ToolRegistry:
         if source is None:
             return len(self._tools)
 
-        return sum(1 for src in self._sources.values() if src == source)
+        # The reverse index is maintained at register/unregister time
+        return len(self._source_to_names.get(source, ()))
+
+    def count_by_source_prefix(self, prefix: str) -> int:
+        """
+        Count tools whose source starts with a prefix (e.g. "mcp:").
+
+        Args:
+            prefix: Source prefix to match
+
+        Returns:
+            Number of tools across all matching sources
+        """
+        return sum(
+            len(names) for source, names in self._source_to_names.items()
+            if source.startswith(prefix)
+        )
 
     def _is_allowed(self, tool_name: str) -> bool:
         """
@@ -270,14 +367,16 @@ class ToolRegistry:
         Returns:
             Dictionary representation of the registry
         """
+        sources = self._sources
+        name_to_tags = self._name_to_tags
         return {
             "tools": {
                 name: {
-                    "definition": tool.to_dict(),
-                    "source": self._sources.get(name),
-                    "tags": self.get_tags(name),
+                    "definition": definition,
+                    "source": sources.get(name),
+                    "tags": list(name_to_tags.get(name, ())),
                 }
-                for name, tool in self._tools.items()
+                for name, definition in self._def_cache.items()
             },
             "stats": {
                 "total_tools": len(self._tools),
@@ -291,24 +390,20 @@ class ToolRegistry:
         return f"ToolRegistry(tools={len(self._tools)}, sources={len(self.list_sources())})"
 
 
-# Global registry instance
-_global_registry: Optional[ToolRegistry] = None
-
-
+@functools.lru_cache(maxsize=None)
 def get_global_registry() -> ToolRegistry:
     """
     Get the global tool registry instance.
 
+    The lru_cache wrapper makes the repeat call a C-level cache hit
+    instead of a Python-level None check against a module global.
+
     Returns:
         The global ToolRegistry instance
     """
-    global _global_registry
-    if _global_registry is None:
-        _global_registry = ToolRegistry()
-    return _global_registry
+    return ToolRegistry()
 
 
 def reset_global_registry():
     """Reset the global registry (useful for testing)."""
-    global _global_registry
-    _global_registry = None
+    get_global_registry.cache_clear()
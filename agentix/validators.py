@@ -1,120 +1,399 @@
+import errno
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import os
-import yaml
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    """Import PyYAML on first use and return (module, loader class).
+
+    Only validate_tasks touches YAML; deferring the import keeps it off
+    the cold-start path of callers that just check specs, plans, or
+    file content. libyaml's C scanner/parser is several times faster
+    than PyYAML's pure-Python one and ships in the default manylinux
+    wheels; fall back to the Python implementation where it isn't
+    compiled in.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
-class Validator:
-    """Utility class for validating specs, plans, and tasks."""
 
-    @staticmethod
-    def validate_spec(spec_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate that a specification file exists and has required sections."""
-        if not os.path.exists(spec_path):
-            return False, "Specification file not found"
+class Task(NamedTuple):
+    """Immutable record of one validated task.
+
+    Consumers iterating large task lists read fields by offset instead
+    of hashing string keys into the raw YAML dicts; compiled_tasks
+    returns a tuple of these for a validated tasks file. The records
+    live beside the parsed dict, never inside it - the dict must stay
+    plain YAML types because the orchestrator round-trips it through
+    yaml.dump when it updates task statuses.
+    """
+    id: Any
+    description: str
+    status: str
+    action: str
+    path: str
+    command: Optional[str] = None
+    context_files: Tuple[str, ...] = ()
+
+# Parsed-tasks cache keyed by absolute path. An entry stays valid while
+# the file's (st_mtime_ns, st_size) signature is unchanged, so iterative
+# agent loops that revalidate the same tasks file pay one stat and a
+# dict probe instead of re-reading and re-running the YAML scanner.
+# Each entry carries the validation result and the compiled Task
+# records side by side. Cached results (including the parsed data) are
+# shared between calls and must be treated as read-only.
+_TASKS_CACHE: Dict[str, Tuple[int, int, Tuple[bool, Optional[str], Optional[Dict]],
+                              Optional[Tuple[Task, ...]]]] = {}
+
+# Spec/plan verdicts under the same (st_mtime_ns, st_size) discipline.
+# A verdict is a pure function of the file bytes, so while the signature
+# holds, revalidation is a stat plus a dict probe - no read, no scan.
+# Entries self-invalidate on rewrite; GIL-atomic dict ops need no lock.
+_VERDICT_CACHE: Dict[str, Tuple[int, int, Tuple[bool, Optional[str]]]] = {}
+
+# Per-task schema, fixed at import: field tuple preserves the reporting
+# order, frozensets make the status/action membership tests O(1)
+# LLM-artifact phrases, folded into one case-insensitive alternation so
+# content is swept once instead of lowercased and scanned per pattern;
+# the Python-hint probe is likewise a single compiled search
+_UNWANTED_PATTERNS = (
+    "I apologize",
+    "I cannot",
+    "As an AI",
+    "I don't have access",
+    "I'm not able to",
+)
+_UNWANTED_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in _UNWANTED_PATTERNS),
+    re.IGNORECASE,
+)
+_PY_HINT_RE = re.compile(r"def |class |import ")
+
+# Everything between the first "---yaml" marker and the next "---" (or
+# end of file), captured in one C-level scan; matches the semantics of
+# the old split("---yaml")[1].split("---")[0] without materializing the
+# intermediate pieces
+_YAML_BLOCK_RE = re.compile(r"---yaml(.*?)(?:---|\Z)", re.DOTALL)
+
+_REQUIRED_TASK_FIELDS = ("id", "description", "status", "action", "path")
+_VALID_STATUSES = frozenset(("pending", "completed", "failed", "in_progress"))
+_VALID_ACTIONS = frozenset(("create_file", "edit_file", "delete_file", "run_command"))
+
+# Required sections are found with one case-insensitive multi-pattern
+# sweep instead of one full content scan per section; the tuples keep
+# the original order for the "missing sections" message. The patterns
+# are ASCII, so the files are scanned as raw bytes - no UTF-8 decode
+# and no lowercased copy of the content
+_SPEC_SECTIONS = ("goal", "user stor", "acceptance")
+_SPEC_SECTIONS_RE = re.compile("|".join(_SPEC_SECTIONS).encode(), re.IGNORECASE)
+_PLAN_SECTIONS = ("architecture", "file", "testing")
+_PLAN_SECTIONS_RE = re.compile("|".join(_PLAN_SECTIONS).encode(), re.IGNORECASE)
+
+
+def _missing_sections(content: bytes, pattern: 're.Pattern',
+                      sections: Tuple[str, ...]) -> List[str]:
+    """Return the sections with no match in content, in given order.
+
+    One pass over the bytes reports every section it contains; the scan
+    stops early once all are found.
+    """
+    found = set()
+    want = len(sections)
+    for match in pattern.finditer(content):
+        found.add(match.group(0).lower().decode())
+        if len(found) == want:
+            break
+    return [section for section in sections if section not in found]
+
+@functools.lru_cache(maxsize=256)
+def _dir_entries(dirpath: str) -> frozenset:
+    """Names present in a directory, via one cached scandir.
+
+    Task batches probe many paths under a handful of directories; one
+    listing per directory answers them all from memory instead of one
+    stat syscall per probe. Stale after external writes - the task
+    executor must call Validator.invalidate_fs_cache() after mutating
+    the tree.
+    """
+    try:
+        with os.scandir(dirpath) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
 
-        try:
-            with open(spec_path, "r") as f:
-                content = f.read()
 
-            if len(content.strip()) == 0:
-                return False, "Specification file is empty"
+def _read_or_err(path: str, label: str, st: os.stat_result):
+    """Read an already-statted file, deriving preconditions from its stat.
 
-            # Check for key sections (flexible matching)
-            required_sections = ["goal", "user stor", "acceptance"]
-            content_lower = content.lower()
+    The caller's stat supplies the size for the empty short-circuit, so
+    empty files are rejected without opening them. Returns a
+    (content, error) pair where exactly one side is set.
+    """
+    if st.st_size == 0:
+        return None, f"{label} file is empty"
 
-            missing = []
-            for section in required_sections:
-                if section not in content_lower:
-                    missing.append(section)
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except OSError as e:
+        return None, f"Error reading {label.lower()}: {e}"
 
-            if missing:
-                return False, f"Specification missing sections: {', '.join(missing)}"
+    if content.isspace():
+        return None, f"{label} file is empty"
 
-            return True, None
-        except Exception as e:
-            return False, f"Error reading specification: {str(e)}"
+    return content, None
 
-    @staticmethod
-    def validate_plan(plan_path: str) -> Tuple[bool, Optional[str]]:
-        """Validate that a plan file exists and has required sections."""
-        if not os.path.exists(plan_path):
-            return False, "Plan file not found"
 
+def _validate_sections(path: str, label: str, pattern: 're.Pattern',
+                       sections: Tuple[str, ...]) -> Tuple[bool, Optional[str]]:
+    """Check a sectioned document, memoizing the verdict per signature.
+
+    The cache is probed on the stat alone, so a warm revalidation never
+    opens the file. Missing and empty files are answered from the same
+    stat without reading; read errors are transient and skip the cache.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, f"{label} file not found"
+
+    key = os.path.abspath(path)
+    cached = _VERDICT_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    content, error = _read_or_err(path, label, st)
+    if content is None:
+        return False, error
+
+    missing = _missing_sections(content, pattern, sections)
+    if missing:
+        verdict = (False, f"{label} missing sections: {', '.join(missing)}")
+    else:
+        verdict = (True, None)
+    _VERDICT_CACHE[key] = (st.st_mtime_ns, st.st_size, verdict)
+    return verdict
+
+
+def _cached_exists(path: str) -> bool:
+    """Existence check answered from the cached parent listing."""
+    dirpath, name = os.path.split(path)
+    if not name:
+        # Trailing-separator path; fall back to a direct probe
+        return os.path.exists(path)
+    return name in _dir_entries(dirpath or ".")
+
+
+@functools.lru_cache(maxsize=32)
+def _root_joiner(root_dir: str):
+    """Return a join specialized for one root directory.
+
+    Batches join every task path and context file against the same
+    root; precomputing the separator-terminated prefix reduces each
+    join to an isabs test plus one concatenation, instead of
+    os.path.join revalidating the root per call.
+    """
+    prefix = root_dir.rstrip(os.sep) + os.sep if root_dir else ""
+    isabs = os.path.isabs
+
+    def join(path: str) -> str:
+        return path if isabs(path) else prefix + path
+
+    return join
+
+
+def _validate_edit_file(full_path: str, path: str, task: Dict) -> Optional[str]:
+    """Precondition check for edit_file tasks."""
+    if not _cached_exists(full_path):
+        return f"Cannot edit non-existent file: {path}"
+    return None
+
+
+def _validate_create_file(full_path: str, path: str, task: Dict) -> Optional[str]:
+    """Precondition check for create_file tasks."""
+    # lexists flags dangling symlinks at the target too, and a bare
+    # makedirs(exist_ok=True) covers the existing-parent case without a
+    # separate probe - one stat each instead of three
+    if os.path.lexists(full_path):
+        return f"File already exists: {path}"
+
+    parent_dir = os.path.dirname(full_path)
+    if parent_dir:
         try:
-            with open(plan_path, "r") as f:
-                content = f.read()
+            os.makedirs(parent_dir, exist_ok=True)
+        except OSError as e:
+            return f"Cannot create parent directory: {str(e)}"
+    return None
 
-            if len(content.strip()) == 0:
-                return False, "Plan file is empty"
 
-            # Check for key sections
-            required_sections = ["architecture", "file", "testing"]
-            content_lower = content.lower()
+def _validate_delete_file(full_path: str, path: str, task: Dict) -> Optional[str]:
+    """Precondition check for delete_file tasks."""
+    if not _cached_exists(full_path):
+        return f"Cannot delete non-existent file: {path}"
+    return None
 
-            missing = []
-            for section in required_sections:
-                if section not in content_lower:
-                    missing.append(section)
 
-            if missing:
-                return False, f"Plan missing sections: {', '.join(missing)}"
+def _validate_run_command(full_path: str, path: str, task: Dict) -> Optional[str]:
+    """Precondition check for run_command tasks."""
+    if not task.get("command"):
+        return "run_command task missing 'command' field"
+    return None
+
+
+# Action -> precondition handler: a hash lookup replaces the if/elif
+# string-compare chain, and new actions plug in without touching the
+# validation body
+_ACTION_VALIDATORS = {
+    "edit_file": _validate_edit_file,
+    "create_file": _validate_create_file,
+    "delete_file": _validate_delete_file,
+    "run_command": _validate_run_command,
+}
 
-            return True, None
-        except Exception as e:
-            return False, f"Error reading plan: {str(e)}"
+
+class Validator:
+    """Utility class for validating specs, plans, and tasks."""
+
+    @staticmethod
+    def invalidate_fs_cache():
+        """Drop cached directory listings after filesystem mutations."""
+        _dir_entries.cache_clear()
+
+    @staticmethod
+    def validate_spec(spec_path: str) -> Tuple[bool, Optional[str]]:
+        """Validate that a specification file exists and has required sections.
+
+        Verdicts are cached per path until the file's mtime or size
+        changes.
+        """
+        return _validate_sections(spec_path, "Specification",
+                                  _SPEC_SECTIONS_RE, _SPEC_SECTIONS)
+
+    @staticmethod
+    def validate_plan(plan_path: str) -> Tuple[bool, Optional[str]]:
+        """Validate that a plan file exists and has required sections.
+
+        Verdicts are cached per path until the file's mtime or size
+        changes.
+        """
+        return _validate_sections(plan_path, "Plan",
+                                  _PLAN_SECTIONS_RE, _PLAN_SECTIONS)
 
     @staticmethod
     def validate_tasks(tasks_path: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
-        """Validate tasks file format and return parsed data."""
-        if not os.path.exists(tasks_path):
+        """Validate tasks file format and return parsed data.
+
+        Results are cached per path until the file's mtime or size
+        changes; repeat callers share the returned data.
+        """
+        try:
+            st = os.stat(tasks_path)
+        except OSError:
             return False, "Tasks file not found", None
 
+        key = os.path.abspath(tasks_path)
+        cached = _TASKS_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        if st.st_size == 0:
+            # Nothing to read: an empty file cannot contain a YAML block
+            result, compiled = (False, "Tasks file missing YAML block", None), None
+        else:
+            result, compiled = Validator._validate_tasks_uncached(tasks_path)
+        _TASKS_CACHE[key] = (st.st_mtime_ns, st.st_size, result, compiled)
+        return result
+
+    @staticmethod
+    def compiled_tasks(tasks_path: str) -> Optional[Tuple[Task, ...]]:
+        """Return the compiled Task records for a valid tasks file.
+
+        Validates (or revalidates) the file through the same cache as
+        validate_tasks; returns None when the file does not validate.
+        """
+        is_valid, _, _ = Validator.validate_tasks(tasks_path)
+        if not is_valid:
+            return None
+        cached = _TASKS_CACHE.get(os.path.abspath(tasks_path))
+        return cached[3] if cached is not None else None
+
+    @staticmethod
+    def _validate_tasks_uncached(tasks_path: str):
+        """Parse and validate a tasks file, bypassing the cache.
+
+        Returns a ((is_valid, error, tasks_data), compiled) pair where
+        compiled is the Task record tuple for valid files.
+        """
         try:
             with open(tasks_path, "r") as f:
                 content = f.read()
 
             # Extract and parse YAML
-            if "---yaml" not in content:
-                return False, "Tasks file missing YAML block", None
+            match = _YAML_BLOCK_RE.search(content)
+            if not match:
+                return (False, "Tasks file missing YAML block", None), None
 
             try:
-                yaml_part = content.split("---yaml")[1].split("---")[0]
-                tasks_data = yaml.safe_load(yaml_part)
+                yaml, loader = _yaml()
+                tasks_data = yaml.load(match.group(1), Loader=loader)
             except Exception as e:
-                return False, f"Invalid YAML format: {str(e)}", None
+                return (False, f"Invalid YAML format: {str(e)}", None), None
 
             if not tasks_data or "tasks" not in tasks_data:
-                return False, "Tasks YAML missing 'tasks' key", None
+                return (False, "Tasks YAML missing 'tasks' key", None), None
 
             # Validate each task
             tasks = tasks_data.get("tasks", [])
             if not tasks:
-                return False, "No tasks defined", None
+                return (False, "No tasks defined", None), None
 
             for i, task in enumerate(tasks):
                 # Check required fields
-                required_fields = ["id", "description", "status", "action", "path"]
-                for field in required_fields:
+                for field in _REQUIRED_TASK_FIELDS:
                     if field not in task:
-                        return False, f"Task {i+1} missing required field: {field}", None
+                        return (False, f"Task {i+1} missing required field: {field}", None), None
 
                 # Validate status
-                valid_statuses = ["pending", "completed", "failed", "in_progress"]
-                if task["status"] not in valid_statuses:
-                    return False, f"Task {task['id']} has invalid status: {task['status']}", None
+                if task["status"] not in _VALID_STATUSES:
+                    return (False, f"Task {task['id']} has invalid status: {task['status']}", None), None
 
                 # Validate action
-                valid_actions = ["create_file", "edit_file", "delete_file", "run_command"]
-                if task["action"] not in valid_actions:
-                    return False, f"Task {task['id']} has invalid action: {task['action']}", None
-
-            return True, None, tasks_data
+                if task["action"] not in _VALID_ACTIONS:
+                    return (False, f"Task {task['id']} has invalid action: {task['action']}", None), None
+
+            # Validation guarantees the required keys are present, so
+            # the dict -> record copy happens exactly once here. The
+            # records are cached beside tasks_data, not inside it:
+            # Task objects are not YAML-serializable and tasks_data is
+            # dumped back to tasks.md after each completed task
+            compiled = tuple(
+                Task(
+                    id=task["id"],
+                    description=task["description"],
+                    status=task["status"],
+                    action=task["action"],
+                    path=task["path"],
+                    command=task.get("command"),
+                    context_files=tuple(task.get("context_files") or ()),
+                )
+                for task in tasks
+            )
+
+            return (True, None, tasks_data), compiled
         except Exception as e:
-            return False, f"Error validating tasks: {str(e)}", None
+            return (False, f"Error validating tasks: {str(e)}", None), None
 
     @staticmethod
     def validate_task_execution(task: Dict, root_dir: str) -> Tuple[bool, Optional[str]]:
@@ -125,76 +404,91 @@ class Validator:
         if not path:
             return False, "Task missing path"
 
-        full_path = os.path.join(root_dir, path)
+        join = _root_joiner(root_dir)
+        full_path = join(path)
 
         # Action-specific validation
-        if action == "edit_file":
-            if not os.path.exists(full_path):
-                return False, f"Cannot edit non-existent file: {path}"
-
-        elif action == "create_file":
-            if os.path.exists(full_path):
-                return False, f"File already exists: {path}"
-
-            # Check parent directory exists or can be created
-            parent_dir = os.path.dirname(full_path)
-            if parent_dir and not os.path.exists(parent_dir):
-                try:
-                    os.makedirs(parent_dir, exist_ok=True)
-                except Exception as e:
-                    return False, f"Cannot create parent directory: {str(e)}"
-
-        elif action == "delete_file":
-            if not os.path.exists(full_path):
-                return False, f"Cannot delete non-existent file: {path}"
-
-        elif action == "run_command":
-            # Basic validation for run_command
-            if not task.get("command"):
-                return False, "run_command task missing 'command' field"
+        handler = _ACTION_VALIDATORS.get(action)
+        if handler is not None:
+            error = handler(full_path, path, task)
+            if error:
+                return False, error
 
         # Validate context files exist
         for context_file in task.get("context_files", []):
-            context_path = os.path.join(root_dir, context_file)
-            if not os.path.exists(context_path):
+            if not _cached_exists(join(context_file)):
                 return False, f"Context file not found: {context_file}"
 
         return True, None
 
+    @staticmethod
+    def validate_task_executions_batch(tasks: List[Dict], root_dir: str,
+                                       workers: int = 8) -> List[Tuple[bool, Optional[str]]]:
+        """Validate many tasks against one root in a single batch.
+
+        Every parent directory the batch touches is listed up front, in
+        parallel - the GIL is released during the scandir syscalls, so
+        cold-cache listings overlap across worker threads - and the
+        per-task checks then run against the in-memory listings instead
+        of issuing a stat per path per task.
+        """
+        join = _root_joiner(root_dir)
+        directories = set()
+        for task in tasks:
+            path = task.get("path")
+            if path:
+                directories.add(os.path.dirname(join(path)))
+            for context_file in task.get("context_files", []) or ():
+                directories.add(os.path.dirname(join(context_file)))
+
+        directories = [dirpath or "." for dirpath in directories]
+        if workers > 1 and len(directories) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(directories))) as pool:
+                # Consume the iterator so listing errors surface here
+                list(pool.map(_dir_entries, directories))
+        else:
+            for dirpath in directories:
+                _dir_entries(dirpath)
+
+        return [
+            Validator.validate_task_execution(task, root_dir)
+            for task in tasks
+        ]
+
     @staticmethod
     def validate_file_content(content: str, file_type: str = "unknown") -> Tuple[bool, Optional[str]]:
         """Validate that generated file content is reasonable."""
-        if not content or len(content.strip()) == 0:
+        if not content or content.isspace():
             return False, "Generated content is empty"
 
         # Check for common LLM artifacts that shouldn't be in the file
-        unwanted_patterns = [
-            "I apologize",
-            "I cannot",
-            "As an AI",
-            "I don't have access",
-            "I'm not able to"
-        ]
-
-        for pattern in unwanted_patterns:
-            if pattern.lower() in content.lower():
-                return False, f"Content contains unwanted pattern: {pattern}"
+        match = _UNWANTED_RE.search(content)
+        if match:
+            return False, f"Content contains unwanted pattern: {match.group(0)}"
 
         # File type specific validation
-        if file_type in ["py", "python"]:
+        if file_type in ("py", "python"):
             # Check for basic Python syntax (very basic check)
-            if "def " not in content and "class " not in content and "import " not in content:
+            if not _PY_HINT_RE.search(content):
                 return False, "Python file appears to have no functions, classes, or imports"
 
         return True, None
 
+# errno -> message prefix for the common failure modes; one OSError
+# handler with a dict probe replaces the per-subclass except chain
+_OSERROR_LABELS = {
+    errno.EACCES: "Permission denied",
+    errno.EPERM: "Permission denied",
+    errno.ENOENT: "File not found",
+}
+
+
 def safe_file_operation(operation, *args, **kwargs):
     """Wrapper for safe file operations with error handling."""
     try:
         return operation(*args, **kwargs)
-    except PermissionError as e:
-        raise ValidationError(f"Permission denied: {str(e)}")
-    except FileNotFoundError as e:
-        raise ValidationError(f"File not found: {str(e)}")
+    except OSError as e:
+        label = _OSERROR_LABELS.get(e.errno, "File operation failed")
+        raise ValidationError(f"{label}: {e}") from e
     except Exception as e:
-        raise ValidationError(f"File operation failed: {str(e)}")
+        raise ValidationError(f"File operation failed: {e}") from e
@@ -35,6 +35,9 @@ setup(
         "requests>=2.28.0",  # For OpenRouter and Ollama
     ],
     extras_require={
+        "perf": [
+            "orjson>=3.8.0",  # Faster JSON for large chat payloads
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
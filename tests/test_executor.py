@@ -0,0 +1,80 @@
+import pytest
+from agentix.tools.base import Tool, ToolParameter, ToolParameterType, ToolResult
+from agentix.tools.executor import ToolExecutor, _cache_key
+from agentix.tools.registry import ToolRegistry
+
+
+class CountingArrayTool(Tool):
+    """Cacheable tool with an ARRAY parameter, counting real executions."""
+
+    cacheable = True
+
+    def __init__(self):
+        self.calls = 0
+        super().__init__()
+
+    @property
+    def name(self):
+        return "counting_array"
+
+    @property
+    def description(self):
+        return "Echoes a list parameter and counts invocations"
+
+    @property
+    def parameters(self):
+        return [
+            ToolParameter(
+                name="items",
+                type=ToolParameterType.ARRAY,
+                description="Arbitrary list payload",
+                required=True,
+            )
+        ]
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        return ToolResult(success=True, data=kwargs["items"])
+
+
+class TestResultCacheKeys:
+    """Tests for result caching of tools with unhashable parameters"""
+
+    def test_cache_key_with_list_value_is_hashable(self):
+        """List-valued parameters must produce a usable dict key"""
+        key = _cache_key("tool", {"items": [1, 2]})
+        hash(key)  # must not raise
+        assert key == _cache_key("tool", {"items": [1, 2]})
+        assert key != _cache_key("tool", {"items": [2, 1]})
+
+    def test_execute_cacheable_tool_with_list_parameter(self):
+        """A cacheable tool with an ARRAY parameter returns a result"""
+        tool = CountingArrayTool()
+        registry = ToolRegistry()
+        registry.register(tool, source="builtin")
+        executor = ToolExecutor(registry=registry)
+
+        try:
+            result = executor.execute("counting_array", {"items": [1, 2]})
+            assert result.success is True
+            assert result.data == [1, 2]
+        finally:
+            executor.shutdown()
+
+    def test_repeat_call_with_list_parameter_hits_cache(self):
+        """Identical list-valued calls are answered from the cache"""
+        tool = CountingArrayTool()
+        registry = ToolRegistry()
+        registry.register(tool, source="builtin")
+        executor = ToolExecutor(registry=registry)
+
+        try:
+            executor.execute("counting_array", {"items": [1, 2]})
+            executor.execute("counting_array", {"items": [1, 2]})
+            assert tool.calls == 1
+
+            batch = executor.execute_batch([("counting_array", {"items": [1, 2]})])
+            assert batch[0].success is True
+            assert tool.calls == 1
+        finally:
+            executor.shutdown()